@@ -1,18 +1,31 @@
 import argparse
+import asyncio
 import json
-import time
-from typing import List, Dict, Optional
+import sys
+from functools import lru_cache
+from itertools import islice
+from typing import Iterator, List, Dict, Optional, Tuple
 from pathlib import Path
-import requests
+from urllib.parse import quote_plus
+import aiohttp
+from aiolimiter import AsyncLimiter
 from bs4 import BeautifulSoup
+from diskcache import Cache
 import re
 
+try:
+    from selectolax.parser import HTMLParser  # Much faster than html.parser on SERP-sized pages
+except ImportError:  # selectolax not installed; fall back to BeautifulSoup
+    HTMLParser = None
+
 # Google Sheets integration
 from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
+from googleapiclient.model import JsonModel
+import orjson
 
 # Scopes for Google Sheets
 SCOPES = [
@@ -20,12 +33,154 @@ SCOPES = [
     "https://www.googleapis.com/auth/drive.metadata.readonly",
 ]
 
+# HTTP settings for the concurrent search fan-out
+GOOGLE_SEARCH_URL = "https://www.google.com/search?q="
+HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+    'Accept-Encoding': 'gzip, deflate, br',  # Brotli is decoded natively by aiohttp[speedups]
+}
+REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=10)
+MAX_CONCURRENT_REQUESTS = 4  # Per-host cap so we stay respectful to Google
+REQUESTS_PER_SECOND = 5  # Token bucket shared by every strategy
+MAX_RETRIES = 2
+RETRY_BACKOFF = 0.3  # Seconds, doubled on each retry
+
+# On-disk cache of Google result pages so repeated searches skip the network
+SERP_CACHE_DIR = Path(__file__).parent.parent / ".serp_cache"
+SERP_CACHE_TTL = 6 * 3600  # Seconds
+
+# Look for a leading "First Last", else "Name - Title" anywhere, else "Name: Title"
+# anywhere, in one anchored match. The dash and colon forms sit in lookaheads so
+# a dash later in the title still beats an earlier colon, as with separate searches.
+# (A leading "First Middle Last" always starts with a leading "First Last", so it
+# never had a chance to match and needs no branch.)
+NAME_PATTERN = re.compile(
+    r'(?s)^(?:(?P<lead>[A-Z][a-z]+ [A-Z][a-z]+)'  # First Last
+    r'|(?=.*?(?P<dash>[A-Z][a-z]+ [A-Z][a-z]+) -)'  # Name - Title
+    r'|(?=.*?(?P<colon>[A-Z][a-z]+ [A-Z][a-z]+):))'  # Name: Title
+)
+
+# Look for common location patterns
+LOCATION_PATTERNS = [
+    re.compile(r'([A-Z][a-z]+, [A-Z]{2})'),  # City, State
+    re.compile(r'([A-Z][a-z]+ [A-Z][a-z]+)'),  # City State
+]
+
+# Opening tag of a Google result block (a div with "g" anywhere in its class list,
+# as CSS div.g matches); used to slice out just the top results before parsing
+# instead of building the whole page's DOM
+RESULT_BLOCK_PATTERN = re.compile(r'<div[^>]*\sclass="(?:[^"]*\s)?g(?:\s[^"]*)?"')
+MAX_RESULTS_PER_PAGE = 5
+
+# Spreadsheet layout: speaker fields copied per row, then tracking columns
+SHEET_HEADERS = ["Name", "Title", "Location", "Source", "Query", "Contact Status", "Notes", "Snippet"]
+SHEET_ROW_KEYS = ("name", "title", "location", "source", "query")
+HEADER_FORMAT = {
+    "backgroundColor": {"red": 0.2, "green": 0.6, "blue": 0.9},
+    "textFormat": {"bold": True, "foregroundColor": {"red": 1, "green": 1, "blue": 1}}
+}
+
+# Search strategies: query templates, optional title keyword regex, and the
+# source/location tags recorded on each speaker (location None = parse snippet)
+SEARCH_STRATEGIES = (
+    {
+        "templates": ('"{query}" expert speaker', '"{query}" thought leader', '"{query}" industry specialist', '"{query}" keynote speaker'),
+        "keywords": None,
+        "source": "Google Search",
+        "location": None,
+    },
+    {
+        "templates": ('"{query}" conference speaker', '"{query}" event presenter', '"{query}" summit speaker'),
+        "keywords": re.compile(r'speaker|presenter|conference|event', re.IGNORECASE),
+        "source": "Conference Search",
+        "location": "Conference/Event",
+    },
+    {
+        "templates": ('"{query}" CEO founder', '"{query}" executive director', '"{query}" industry leader'),
+        "keywords": re.compile(r'ceo|founder|executive|director', re.IGNORECASE),
+        "source": "Industry Search",
+        "location": "Industry",
+    },
+    {
+        "templates": ('"{query}" professor researcher', '"{query}" academic expert', '"{query}" university faculty'),
+        "keywords": re.compile(r'professor|researcher|university|academic', re.IGNORECASE),
+        "source": "Academic Search",
+        "location": "Academic",
+    },
+)
+
+
+@lru_cache(maxsize=4096)
+def _extract_name(title: str) -> Optional[str]:
+    """Match NAME_PATTERN against a title; cached since titles repeat across queries."""
+    match = NAME_PATTERN.match(title)
+    if not match:
+        return None
+    
+    name = (match.group('lead') or match.group('dash') or match.group('colon')).strip()
+    # Basic validation - should be 2-4 words, mostly letters
+    if 2 <= len(name.split()) <= 4 and name.replace(' ', '').isalpha():
+        return name
+    
+    return None
+
+
+@lru_cache(maxsize=4096)
+def _extract_location(snippet: str) -> str:
+    """Match LOCATION_PATTERNS against a snippet; cached like _extract_name."""
+    for pattern in LOCATION_PATTERNS:
+        match = pattern.search(snippet)
+        if match:
+            return sys.intern(match.group(1))  # Cities repeat across many results
+    
+    return "Unknown"
+
+
+class OrjsonModel(JsonModel):
+    """googleapiclient response model that parses with orjson.
+
+    Requests keep JsonModel's json.dumps: its ASCII-escaped output is what the
+    client's character-counted Content-Length and Latin-1 body encoding expect.
+    """
+    
+    def deserialize(self, content):
+        try:
+            body = orjson.loads(content)
+        except orjson.JSONDecodeError:
+            return content  # Match JsonModel: hand back non-JSON bodies untouched
+        if self._data_wrapper and "data" in body:
+            body = body["data"]
+        return body
+
 
 class SimpleSpeakerSourcingAgent:
     def __init__(self):
-        self.sheets_service = None
-        self.drive_service = None
-        self._setup_google_services()
+        # Google services are built on first use so pure searches skip OAuth
+        self._sheets_service = None
+        self._drive_service = None
+        self.serp_cache = Cache(str(SERP_CACHE_DIR))
+    
+    @property
+    def sheets_service(self):
+        if self._sheets_service is None:
+            self._setup_google_services()
+        return self._sheets_service
+    
+    @property
+    def drive_service(self):
+        if self._drive_service is None:
+            self._setup_google_services()
+        return self._drive_service
+    
+    def _create_http_session(self) -> aiohttp.ClientSession:
+        """Create the keep-alive HTTP session shared by every search strategy."""
+        connector = aiohttp.TCPConnector(
+            limit=16,
+            limit_per_host=MAX_CONCURRENT_REQUESTS,
+            ttl_dns_cache=300,
+            resolver=aiohttp.AsyncResolver(),  # aiodns, from aiohttp[speedups]
+        )
+        return aiohttp.ClientSession(headers=HEADERS, timeout=REQUEST_TIMEOUT, connector=connector)
     
     def _setup_google_services(self):
         """Initialize Google Sheets and Drive services."""
@@ -46,320 +201,187 @@ class SimpleSpeakerSourcingAgent:
             with open(token_path, "w") as token:
                 token.write(creds.to_json())
         
-        self.sheets_service = build("sheets", "v4", credentials=creds)
-        self.drive_service = build("drive", "v3", credentials=creds)
+        self._sheets_service = build("sheets", "v4", credentials=creds, model=OrjsonModel())
+        self._drive_service = build("drive", "v3", credentials=creds, model=OrjsonModel())
     
-    def search_speakers_web(self, query: str, max_results: int = 20) -> List[Dict]:
+    async def search_speakers_web(self, query: str, max_results: int = 20) -> List[Dict]:
         """Search the web for speakers using various sources."""
-        speakers = []
+        query = sys.intern(query)  # Shared by every speaker record
         
         print(f"🔍 Searching for speakers with query: '{query}'")
         
-        # Try multiple search strategies
-        search_strategies = [
-            self._search_google_experts,
-            self._search_conference_speakers,
-            self._search_industry_leaders,
-            self._search_academic_experts
-        ]
-        
-        for strategy in search_strategies:
-            try:
-                results = strategy(query, max_results // len(search_strategies))
-                speakers.extend(results)
-                print(f"✅ Found {len(results)} speakers from {strategy.__name__}")
-                if len(speakers) >= max_results:
-                    break
-            except Exception as e:
-                print(f"⚠️  Error with {strategy.__name__}: {e}")
-                continue
+        # Run every search strategy concurrently and take results as they land
+        per_strategy = max_results // len(SEARCH_STRATEGIES)
+        limiter = AsyncLimiter(REQUESTS_PER_SECOND, time_period=1.0)
+        unique_speakers = {}  # Dedup by normalized name; dicts keep insertion order
         
-        # Remove duplicates and limit results
-        unique_speakers = []
-        seen_names = set()
-        for speaker in speakers:
-            name = speaker.get("name", "").lower().strip()
-            if name and name not in seen_names and len(unique_speakers) < max_results:
-                unique_speakers.append(speaker)
-                seen_names.add(name)
+        async def run_strategy(strategy: Dict):
+            return strategy, await self._scrape_google(session, limiter, query, strategy, per_strategy)
         
-        return unique_speakers
-    
-    def _search_google_experts(self, query: str, max_results: int) -> List[Dict]:
-        """Search Google for industry experts and thought leaders."""
-        speakers = []
-        try:
-            search_queries = [
-                f'"{query}" expert speaker',
-                f'"{query}" thought leader',
-                f'"{query}" industry specialist',
-                f'"{query}" keynote speaker'
-            ]
-            
-            for search_query in search_queries:
-                if len(speakers) >= max_results:
-                    break
+        async with self._create_http_session() as session:
+            tasks = [asyncio.create_task(run_strategy(strategy)) for strategy in SEARCH_STRATEGIES]
+            try:
+                for next_done in asyncio.as_completed(tasks):
+                    try:
+                        strategy, results = await next_done
+                    except Exception as e:
+                        print(f"⚠️  Error with search strategy: {e}")
+                        continue
+                    print(f"✅ Found {len(results)} speakers from {strategy['source']}")
                     
-                search_url = f"https://www.google.com/search?q={search_query.replace(' ', '+')}"
-                headers = {
-                    'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-                }
-                
-                response = requests.get(search_url, headers=headers, timeout=10)
-                soup = BeautifulSoup(response.content, 'html.parser')
-                
-                # Extract search results
-                search_results = soup.find_all("div", class_="g")
-                for result in search_results[:5]:
-                    if len(speakers) >= max_results:
+                    for speaker in results:
+                        name = sys.intern(speaker.get("name", "").lower().strip())
+                        if name and name not in unique_speakers:
+                            unique_speakers[name] = speaker
+                            if len(unique_speakers) >= max_results:
+                                break
+                    if len(unique_speakers) >= max_results:
                         break
-                        
-                    title_element = result.find("h3")
-                    snippet_element = result.find("div", class_="VwiC3b")
-                    
-                    if title_element:
-                        title = title_element.text.strip()
-                        snippet = snippet_element.text.strip() if snippet_element else ""
-                        
-                        # Look for names and titles in the result
-                        potential_name = self._extract_name_from_title(title, snippet)
-                        if potential_name:
-                            speakers.append({
-                                "name": potential_name,
-                                "title": title[:100],  # Truncate long titles
-                                "location": self._extract_location(snippet),
-                                "source": "Google Search",
-                                "query": query,
-                                "snippet": snippet[:200]  # Truncate long snippets
-                            })
-                
-                time.sleep(1)  # Be respectful to Google
-                
-        except Exception as e:
-            print(f"Error in Google expert search: {e}")
+            finally:
+                # Stop any strategies still running once we have enough speakers
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
         
-        return speakers
+        return list(unique_speakers.values())
     
-    def _search_conference_speakers(self, query: str, max_results: int) -> List[Dict]:
-        """Search for conference speakers and presenters."""
-        speakers = []
-        try:
-            search_queries = [
-                f'"{query}" conference speaker',
-                f'"{query}" event presenter',
-                f'"{query}" summit speaker'
-            ]
+    async def _fetch_search_pages(self, session: aiohttp.ClientSession, limiter: AsyncLimiter, search_queries: List[str]) -> List[str]:
+        """Fetch the Google result pages for all queries concurrently."""
+        async def fetch(search_query: str) -> str:
+            search_url = GOOGLE_SEARCH_URL + quote_plus(search_query)  # Encodes the quotes too
+            cached = self.serp_cache.get(search_url)
+            if cached is not None:
+                return cached
             
-            for search_query in search_queries:
-                if len(speakers) >= max_results:
-                    break
-                    
-                search_url = f"https://www.google.com/search?q={search_query.replace(' ', '+')}"
-                headers = {
-                    'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-                }
-                
-                response = requests.get(search_url, headers=headers, timeout=10)
-                soup = BeautifulSoup(response.content, 'html.parser')
-                
-                # Look for conference-related results
-                search_results = soup.find_all("div", class_="g")
-                for result in search_results[:5]:
-                    if len(speakers) >= max_results:
-                        break
-                        
-                    title_element = result.find("h3")
-                    if title_element:
-                        title = title_element.text.strip()
-                        if any(keyword in title.lower() for keyword in ["speaker", "presenter", "conference", "event"]):
-                            potential_name = self._extract_name_from_title(title, "")
-                            if potential_name:
-                                speakers.append({
-                                    "name": potential_name,
-                                    "title": title[:100],
-                                    "location": "Conference/Event",
-                                    "source": "Conference Search",
-                                    "query": query
-                                })
-                
-                time.sleep(1)
-                
-        except Exception as e:
-            print(f"Error in conference speaker search: {e}")
+            for attempt in range(MAX_RETRIES + 1):
+                try:
+                    async with limiter:
+                        async with session.get(search_url) as response:
+                            html = await response.text(encoding="utf-8", errors="replace")  # Skip charset sniffing
+                            if response.status == 200:
+                                self.serp_cache.set(search_url, html, expire=SERP_CACHE_TTL)
+                    return html
+                except (aiohttp.ClientError, asyncio.TimeoutError):
+                    if attempt == MAX_RETRIES:
+                        raise
+                    await asyncio.sleep(RETRY_BACKOFF * (2 ** attempt))
         
-        return speakers
+        return await asyncio.gather(*(fetch(search_query) for search_query in search_queries))
     
-    def _search_industry_leaders(self, query: str, max_results: int) -> List[Dict]:
-        """Search for industry leaders and executives."""
-        speakers = []
-        try:
-            search_queries = [
-                f'"{query}" CEO founder',
-                f'"{query}" executive director',
-                f'"{query}" industry leader'
-            ]
-            
-            for search_query in search_queries:
-                if len(speakers) >= max_results:
-                    break
-                    
-                search_url = f"https://www.google.com/search?q={search_query.replace(' ', '+')}"
-                headers = {
-                    'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-                }
-                
-                response = requests.get(search_url, headers=headers, timeout=10)
-                soup = BeautifulSoup(response.content, 'html.parser')
-                
-                search_results = soup.find_all("div", class_="g")
-                for result in search_results[:5]:
-                    if len(speakers) >= max_results:
-                        break
-                        
-                    title_element = result.find("h3")
-                    if title_element:
-                        title = title_element.text.strip()
-                        if any(keyword in title.lower() for keyword in ["ceo", "founder", "executive", "director"]):
-                            potential_name = self._extract_name_from_title(title, "")
-                            if potential_name:
-                                speakers.append({
-                                    "name": potential_name,
-                                    "title": title[:100],
-                                    "location": "Industry",
-                                    "source": "Industry Search",
-                                    "query": query
-                                })
-                
-                time.sleep(1)
-                
-        except Exception as e:
-            print(f"Error in industry leader search: {e}")
+    def _slice_top_results(self, html: str) -> str:
+        """Cut the page down to the first few result blocks so the parser skips the rest."""
+        starts = []
+        for match in RESULT_BLOCK_PATTERN.finditer(html):
+            starts.append(match.start())
+            if len(starts) > MAX_RESULTS_PER_PAGE:
+                break
         
-        return speakers
+        if not starts:
+            return html
+        end = starts[MAX_RESULTS_PER_PAGE] if len(starts) > MAX_RESULTS_PER_PAGE else len(html)
+        return html[starts[0]:end]
+    
+    def _parse_search_results(self, html: str, with_snippet: bool = False) -> List[Tuple[str, str]]:
+        """Parse a Google results page into (title, snippet) pairs for the top 5 hits."""
+        html = self._slice_top_results(html)
+        results = []
+        if HTMLParser is not None:
+            for node in HTMLParser(html).css("div.g")[:MAX_RESULTS_PER_PAGE]:
+                title_element = node.css_first("h3")
+                if not title_element:
+                    continue
+                snippet_element = node.css_first("div.VwiC3b") if with_snippet else None
+                results.append((
+                    title_element.text().strip(),
+                    snippet_element.text().strip() if snippet_element else ""
+                ))
+            return results
+        
+        soup = BeautifulSoup(html, 'html.parser')
+        for result in soup.find_all("div", class_="g")[:MAX_RESULTS_PER_PAGE]:
+            title_element = result.find("h3")
+            if not title_element:
+                continue
+            snippet_element = result.find("div", class_="VwiC3b") if with_snippet else None
+            results.append((
+                title_element.text.strip(),
+                snippet_element.text.strip() if snippet_element else ""
+            ))
+        return results
     
-    def _search_academic_experts(self, query: str, max_results: int) -> List[Dict]:
-        """Search for academic experts and researchers."""
+    async def _scrape_google(self, session: aiohttp.ClientSession, limiter: AsyncLimiter, query: str, strategy: Dict, max_results: int) -> List[Dict]:
+        """Run one search strategy: fetch its Google queries and extract speakers."""
         speakers = []
         try:
-            search_queries = [
-                f'"{query}" professor researcher',
-                f'"{query}" academic expert',
-                f'"{query}" university faculty'
-            ]
+            search_queries = [template.format(query=query) for template in strategy["templates"]]
+            pages = await self._fetch_search_pages(session, limiter, search_queries)
             
-            for search_query in search_queries:
-                if len(speakers) >= max_results:
-                    break
-                    
-                search_url = f"https://www.google.com/search?q={search_query.replace(' ', '+')}"
-                headers = {
-                    'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-                }
-                
-                response = requests.get(search_url, headers=headers, timeout=10)
-                soup = BeautifulSoup(response.content, 'html.parser')
-                
-                search_results = soup.find_all("div", class_="g")
-                for result in search_results[:5]:
-                    if len(speakers) >= max_results:
-                        break
-                        
-                    title_element = result.find("h3")
-                    if title_element:
-                        title = title_element.text.strip()
-                        if any(keyword in title.lower() for keyword in ["professor", "researcher", "university", "academic"]):
-                            potential_name = self._extract_name_from_title(title, "")
-                            if potential_name:
-                                speakers.append({
-                                    "name": potential_name,
-                                    "title": title[:100],
-                                    "location": "Academic",
-                                    "source": "Academic Search",
-                                    "query": query
-                                })
-                
-                time.sleep(1)
-                
+            # Parse pages in worker threads so the event loop keeps serving other strategies
+            loop = asyncio.get_running_loop()
+            with_snippet = strategy["location"] is None
+            parsed_pages = await asyncio.gather(
+                *(loop.run_in_executor(None, self._parse_search_results, html, with_snippet) for html in pages)
+            )
+            speakers = list(islice(self._iter_speakers(parsed_pages, query, strategy), max_results))
         except Exception as e:
-            print(f"Error in academic expert search: {e}")
+            print(f"Error in {strategy['source']}: {e}")
         
         return speakers
     
+    def _iter_speakers(self, parsed_pages: List[List[Tuple[str, str]]], query: str, strategy: Dict) -> Iterator[Dict]:
+        """Lazily yield speakers from a strategy's parsed (title, snippet) results."""
+        keywords = strategy["keywords"]
+        location = strategy["location"]
+        for results in parsed_pages:
+            for title, snippet in results:
+                if keywords and not keywords.search(title):
+                    continue
+                
+                # Look for names and titles in the result
+                potential_name = self._extract_name_from_title(title, snippet)
+                if potential_name:
+                    speaker = {
+                        "name": potential_name,
+                        "title": title[:100],  # Truncate long titles
+                        "location": location or self._extract_location(snippet),
+                        "source": strategy["source"],
+                        "query": query
+                    }
+                    if location is None:
+                        speaker["snippet"] = snippet[:200]  # Truncate long snippets
+                    yield speaker
+    
     def _extract_name_from_title(self, title: str, snippet: str) -> Optional[str]:
         """Extract potential names from search result titles and snippets."""
-        # Look for patterns like "Name - Title" or "Name: Title"
-        name_patterns = [
-            r'^([A-Z][a-z]+ [A-Z][a-z]+)',  # First Last
-            r'^([A-Z][a-z]+ [A-Z][a-z]+ [A-Z][a-z]+)',  # First Middle Last
-            r'([A-Z][a-z]+ [A-Z][a-z]+) -',  # Name - Title
-            r'([A-Z][a-z]+ [A-Z][a-z]+):',  # Name: Title
-        ]
-        
-        for pattern in name_patterns:
-            match = re.search(pattern, title)
-            if match:
-                name = match.group(1).strip()
-                # Basic validation - should be 2-4 words, mostly letters
-                if 2 <= len(name.split()) <= 4 and name.replace(' ', '').isalpha():
-                    return name
-        
-        return None
+        return _extract_name(title)
     
     def _extract_location(self, snippet: str) -> str:
         """Extract potential location from snippet."""
-        # Look for common location patterns
-        location_patterns = [
-            r'([A-Z][a-z]+, [A-Z]{2})',  # City, State
-            r'([A-Z][a-z]+ [A-Z][a-z]+)',  # City State
-        ]
-        
-        for pattern in location_patterns:
-            match = re.search(pattern, snippet)
-            if match:
-                return match.group(1)
-        
-        return "Unknown"
+        return _extract_location(snippet)
     
     def create_speakers_spreadsheet(self, speakers: List[Dict], title: str = "Hackathon Speakers") -> str:
         """Create a Google Sheets spreadsheet with speaker information."""
         try:
             print(f"📊 Creating Google Sheets spreadsheet...")
             
-            # Create new spreadsheet
-            body = {"properties": {"title": title}}
-            spreadsheet = self.sheets_service.spreadsheets().create(body=body).execute()
-            spreadsheet_id = spreadsheet["spreadsheetId"]
-            
             # Prepare data for writing
-            headers = ["Name", "Title", "Location", "Source", "Query", "Contact Status", "Notes", "Snippet"]
-            data = [headers]
-            
-            for speaker in speakers:
-                row = [
-                    speaker.get("name", ""),
-                    speaker.get("title", ""),
-                    speaker.get("location", ""),
-                    speaker.get("source", ""),
-                    speaker.get("query", ""),
-                    "Not Contacted",  # Default status
-                    "",  # Notes column
-                    speaker.get("snippet", "")  # Snippet column
-                ]
-                data.append(row)
-            
-            # Write data to sheet
-            range_name = "Sheet1!A1:H" + str(len(data))
-            body = {"values": data}
-            
-            self.sheets_service.spreadsheets().values().update(
-                spreadsheetId=spreadsheet_id,
-                range=range_name,
-                valueInputOption="RAW",
-                body=body
-            ).execute()
+            rows = [
+                [speaker.get(key, "") for key in SHEET_ROW_KEYS] + ["Not Contacted", "", speaker.get("snippet", "")]
+                for speaker in speakers
+            ]
             
-            # Format headers
-            self._format_headers(spreadsheet_id)
+            # Create, populate and format the spreadsheet in a single API call
+            data_rows = [
+                {"values": [{"userEnteredValue": {"stringValue": str(value)}} for value in row]}
+                for row in rows
+            ]
+            try:
+                spreadsheet = self._create_with_rows(title, data_rows, HEADER_FORMAT)
+            except HttpError as e:
+                # Header formatting is cosmetic: if it gets the request rejected, create without it
+                print(f"⚠️  Error formatting headers: {e}")
+                spreadsheet = self._create_with_rows(title, data_rows, None)
+            spreadsheet_id = spreadsheet["spreadsheetId"]
             
             print(f"✅ Spreadsheet created successfully!")
             return spreadsheet_id
@@ -368,36 +390,21 @@ class SimpleSpeakerSourcingAgent:
             print(f"❌ Error creating spreadsheet: {e}")
             return None
     
-    def _format_headers(self, spreadsheet_id: str):
-        """Format the header row to make it stand out."""
-        try:
-            requests = [
-                {
-                    "repeatCell": {
-                        "range": {
-                            "sheetId": 0,
-                            "startRowIndex": 0,
-                            "endRowIndex": 1
-                        },
-                        "cell": {
-                            "userEnteredFormat": {
-                                "backgroundColor": {"red": 0.2, "green": 0.6, "blue": 0.9},
-                                "textFormat": {"bold": True, "foregroundColor": {"red": 1, "green": 1, "blue": 1}}
-                            }
-                        },
-                        "fields": "userEnteredFormat(backgroundColor,textFormat)"
-                    }
-                }
-            ]
-            
-            body = {"requests": requests}
-            self.sheets_service.spreadsheets().batchUpdate(
-                spreadsheetId=spreadsheet_id,
-                body=body
-            ).execute()
-            
-        except Exception as e:
-            print(f"⚠️  Error formatting headers: {e}")
+    def _create_with_rows(self, title: str, data_rows: List[Dict], header_format: Optional[Dict]) -> Dict:
+        """Create a spreadsheet whose first sheet holds the header row plus data_rows."""
+        header_cell = {"userEnteredFormat": header_format} if header_format else {}
+        header_row = {"values": [
+            {"userEnteredValue": {"stringValue": header}, **header_cell}
+            for header in SHEET_HEADERS
+        ]}
+        body = {
+            "properties": {"title": title},
+            "sheets": [{
+                "properties": {"sheetId": 0, "title": "Sheet1"},
+                "data": [{"startRow": 0, "startColumn": 0, "rowData": [header_row, *data_rows]}]
+            }]
+        }
+        return self.sheets_service.spreadsheets().create(body=body).execute()
     
     def search_and_create_sheet(self, requirements: str, max_results: int = 20) -> Optional[str]:
         """Main method: search for speakers and create Google Sheets."""
@@ -406,7 +413,7 @@ class SimpleSpeakerSourcingAgent:
         print("-" * 50)
         
         # Search for speakers
-        speakers = self.search_speakers_web(requirements, max_results)
+        speakers = asyncio.run(self.search_speakers_web(requirements, max_results))
         
         if not speakers:
             print("❌ No speakers found from any source.")
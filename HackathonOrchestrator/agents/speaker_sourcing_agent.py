@@ -1,31 +1,122 @@
 import argparse
+import asyncio
+import hashlib
 import json
-import time
+import logging
+from collections import Counter, defaultdict
+from datetime import datetime
+from functools import cached_property, lru_cache
 from typing import List, Dict, Optional
 from pathlib import Path
-import requests
-from bs4 import BeautifulSoup
-import re
+from urllib.parse import quote_plus
+import aiohttp
+import orjson
+from diskcache import Cache
+from tenacity import retry, retry_if_exception, stop_after_attempt, wait_exponential_jitter
 
-# Google Sheets integration
-from google.auth.transport.requests import Request
-from google.oauth2.credentials import Credentials
-from google_auth_oauthlib.flow import InstalledAppFlow
-from googleapiclient.discovery import build
-from googleapiclient.errors import HttpError
+try:
+    from selectolax.lexbor import LexborHTMLParser  # C HTML5 parser, far faster than html.parser
+except ImportError:  # selectolax not installed; fall back to BeautifulSoup
+    LexborHTMLParser = None
 
 # Scopes for Google Sheets
 SCOPES = [
     "https://www.googleapis.com/auth/spreadsheets",
-    "https://www.googleapis.com/auth/drive.metadata.readonly",
 ]
 
+# Search sources queried concurrently; selector picks each result title
+SEARCH_SOURCES = [
+    {"name": "Google Search", "url": "https://www.google.com/search?q={query}", "selector": "h3"},
+    {"name": "DuckDuckGo Search", "url": "https://html.duckduckgo.com/html/?q={query}", "selector": "a.result__a"},
+    {"name": "Bing Search", "url": "https://www.bing.com/search?q={query}", "selector": "li.b_algo h2"},
+]
+HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36',
+    'Accept-Encoding': 'gzip, deflate'
+}
+REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=10)
+MAX_TITLES_PER_SOURCE = 10
+# Safety bound only: Google can inline several hundred KiB of CSS/JS before the first result
+MAX_PAGE_BYTES = 2 * 1024 * 1024
+MAX_CONCURRENT_REQUESTS = 8
+MAX_RETRIES = 3
+RETRY_BACKOFF = 0.5  # Seconds, doubled on each retry
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+_API_BACKOFF = wait_exponential_jitter(initial=1, max=30)
+
+
+def _is_retryable_api_error(error: BaseException) -> bool:
+    """Retry Google API calls only on rate limiting and transient server errors."""
+    from googleapiclient.errors import HttpError
+    return isinstance(error, HttpError) and error.resp.status in RETRY_STATUSES
+
+
+def _is_rate_limited_api_error(error: BaseException) -> bool:
+    """Retry only 429s: the request was rejected, so nothing was created server-side."""
+    from googleapiclient.errors import HttpError
+    return isinstance(error, HttpError) and error.resp.status == 429
+
+
+def _api_retry_wait(retry_state) -> float:
+    """Honor Retry-After when the API sends one, otherwise back off exponentially."""
+    retry_after = retry_state.outcome.exception().resp.get("retry-after")
+    if retry_after and retry_after.isdigit():
+        return float(retry_after)
+    return _API_BACKOFF(retry_state)
+
+# Spreadsheet columns; the last three are filled in for every speaker
+SHEET_HEADERS = ("Name", "Title", "Location", "Source", "Query", "Expertise", "Contact Status", "Notes", "Last Updated")
+SPEAKER_COLUMNS = ("name", "title", "location", "source", "query", "expertise")
+
+# Sheets rejects batchUpdate calls carrying more requests than this
+MAX_BATCH_REQUESTS = 100
+
+# Google Sheets counts dates as days since this epoch
+SHEETS_EPOCH = datetime(1899, 12, 30)
+
+# On-disk cache of scraped speakers so repeated topics skip the network
+SCRAPE_CACHE_DIR = Path(__file__).parent.parent / ".speaker_cache"
+SCRAPE_CACHE_TTL = 24 * 3600  # Seconds
+
+SEPARATOR = "-" * 50
+
+
+@lru_cache(maxsize=None)
+def _orjson_model():
+    """googleapiclient response model that parses with orjson.
+
+    Requests keep JsonModel's json.dumps: its ASCII-escaped output is what the
+    client's character-counted Content-Length and Latin-1 body encoding expect.
+    """
+    from googleapiclient.model import JsonModel
+    
+    class OrjsonModel(JsonModel):
+        def deserialize(self, content):
+            try:
+                body = orjson.loads(content)
+            except orjson.JSONDecodeError:
+                return content  # Match JsonModel: hand back non-JSON bodies untouched
+            if self._data_wrapper and "data" in body:
+                body = body["data"]
+            return body
+    
+    return OrjsonModel()
+
+
+logger = logging.getLogger(__name__)
+
 
 class RobustSpeakerSourcingAgent:
+    # Built Google API services, shared by every instance in the process
+    _shared_services: Dict[str, object] = {}
+    
     def __init__(self):
-        self.sheets_service = None
-        self.drive_service = None
-        self._setup_google_services()
+        self.scrape_cache = Cache(str(SCRAPE_CACHE_DIR))
+        # Event loop and keep-alive HTTP session reused by every scrape; created on
+        # first use and released by close()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._http_session: Optional[aiohttp.ClientSession] = None
         
         # Demo data for when web scraping fails
         self.demo_speakers = {
@@ -50,9 +141,34 @@ class RobustSpeakerSourcingAgent:
                 {"name": "Jennifer Lee", "title": "Senior Data Scientist", "location": "San Francisco, CA", "source": "Demo Data", "query": "Data Science", "expertise": "Machine Learning, Data Visualization"}
             ]
         }
+        
+        # Inverted index (token -> categories) and category sizes for similarity scoring
+        self._demo_index = defaultdict(set)
+        self._demo_sizes = {}
+        for category in self.demo_speakers:
+            tokens = frozenset(category.lower().split())
+            self._demo_sizes[category] = len(tokens)
+            for token in tokens:
+                self._demo_index[token].add(category)
+        self._demo_order = {category: i for i, category in enumerate(self.demo_speakers)}
+    
+    @cached_property
+    def sheets_service(self):
+        """Google Sheets service, authorized on first use so web search never triggers OAuth."""
+        return self._setup_google_services()
     
     def _setup_google_services(self):
-        """Initialize Google Sheets and Drive services."""
+        """Initialize the Google Sheets service."""
+        shared = RobustSpeakerSourcingAgent._shared_services
+        if shared:
+            return shared["sheets"]
+        
+        # Lazy import so searching alone never loads the Google client libraries
+        from google.auth.transport.requests import Request
+        from google.oauth2.credentials import Credentials
+        from google_auth_oauthlib.flow import InstalledAppFlow
+        from googleapiclient.discovery import build
+        
         creds = None
         token_path = Path(__file__).parent.parent / "token_sheets.json"
         credentials_path = Path(__file__).parent.parent / "credentials.json"
@@ -70,88 +186,166 @@ class RobustSpeakerSourcingAgent:
             with open(token_path, "w") as token:
                 token.write(creds.to_json())
         
-        self.sheets_service = build("sheets", "v4", credentials=creds)
-        self.drive_service = build("drive", "v3", credentials=creds)
+        # Use the discovery documents bundled with googleapiclient; no fetch, no file cache
+        shared["sheets"] = build(
+            "sheets", "v4", credentials=creds, cache_discovery=False, static_discovery=True, model=_orjson_model()
+        )
+        return shared["sheets"]
     
     def search_speakers_web(self, query: str, max_results: int = 20) -> List[Dict]:
         """Search the web for speakers using various sources."""
         speakers = []
         
-        print(f"🔍 Attempting web search for speakers with query: '{query}'")
+        logger.info("🔍 Attempting web search for speakers with query: '%s'", query)
         
         # Try web scraping first
         try:
-            web_speakers = self._attempt_web_scraping(query, max_results)
+            web_speakers = self._cached_web_scraping(query, max_results)
             if web_speakers:
                 speakers.extend(web_speakers)
-                print(f"✅ Found {len(web_speakers)} speakers from web search")
+                logger.info("✅ Found %d speakers from web search", len(web_speakers))
         except Exception as e:
-            print(f"⚠️  Web scraping failed: {e}")
+            logger.warning("⚠️  Web scraping failed: %s", e)
         
         # If web search didn't find enough speakers, use demo data
         if len(speakers) < max_results:
             demo_speakers = self._get_demo_speakers(query, max_results - len(speakers))
             speakers.extend(demo_speakers)
-            print(f"✅ Added {len(demo_speakers)} demo speakers")
+            logger.info("✅ Added %d demo speakers", len(demo_speakers))
         
         return speakers[:max_results]
     
-    def _attempt_web_scraping(self, query: str, max_results: int) -> List[Dict]:
+    def _cached_web_scraping(self, query: str, max_results: int) -> List[Dict]:
+        """Scrape speakers for a query, reusing results cached on disk for the same query."""
+        cache_key = hashlib.blake2b(query.encode("utf-8"), digest_size=16).hexdigest()
+        cached = self.scrape_cache.get(cache_key)
+        # A cached run only answers requests for at most as many results as it asked for
+        if cached is not None and cached["max_results"] >= max_results:
+            return cached["speakers"][:max_results]
+        
+        speakers = self._run(self._attempt_web_scraping(query, max_results))
+        if speakers:
+            self.scrape_cache.set(cache_key, {"max_results": max_results, "speakers": speakers}, expire=SCRAPE_CACHE_TTL)
+        return speakers
+    
+    def _run(self, coro):
+        """Run a coroutine on the agent's own loop, which outlives it so the HTTP session can too."""
+        if self._loop is None:
+            self._loop = asyncio.new_event_loop()
+        return self._loop.run_until_complete(coro)
+    
+    async def _get_http_session(self) -> aiohttp.ClientSession:
+        """Return the keep-alive HTTP session shared by every search source and scrape."""
+        if self._http_session is None or self._http_session.closed:
+            connector = aiohttp.TCPConnector(limit_per_host=4)
+            self._http_session = aiohttp.ClientSession(headers=HEADERS, connector=connector, timeout=REQUEST_TIMEOUT)
+        return self._http_session
+    
+    def close(self) -> None:
+        """Close the HTTP session and its event loop; the next scrape opens new ones."""
+        if self._loop is None:
+            return
+        if self._http_session is not None:
+            self._loop.run_until_complete(self._http_session.close())
+            self._http_session = None
+        self._loop.close()
+        self._loop = None
+    
+    async def _fetch_source(self, session: aiohttp.ClientSession, semaphore: asyncio.Semaphore, source: Dict, query: str) -> str:
+        """Fetch one search source's result page, backing off on rate limits."""
+        search_url = source["url"].format(query=quote_plus(f"{query} speaker expert"))
+        for attempt in range(MAX_RETRIES + 1):
+            async with semaphore:
+                async with session.get(search_url) as response:
+                    if response.status == 200:
+                        return await self._read_page_prefix(response)
+                    if response.status not in RETRY_STATUSES:
+                        return ""
+            await asyncio.sleep(RETRY_BACKOFF * (2 ** attempt))
+        return ""
+    
+    async def _read_page_prefix(self, response: aiohttp.ClientResponse) -> str:
+        """Stream a page body and stop once MAX_PAGE_BYTES have arrived."""
+        buffer = bytearray()
+        async for chunk in response.content.iter_chunked(8192):
+            buffer += chunk
+            if len(buffer) >= MAX_PAGE_BYTES:
+                break
+        # The cut may land inside a multi-byte character; parsers tolerate the replacement
+        return buffer[:MAX_PAGE_BYTES].decode("utf-8", "replace")
+    
+    def _parse_titles(self, html: str, selector: str) -> List[str]:
+        """Extract the result titles from a search page."""
+        if LexborHTMLParser is not None:
+            tree = LexborHTMLParser(html)
+            return [element.text(deep=True, strip=True) for element in tree.css(selector)[:MAX_TITLES_PER_SOURCE]]
+        
+        from bs4 import BeautifulSoup  # Fallback parser, only imported when needed
+        soup = BeautifulSoup(html, 'html.parser')
+        return [element.text.strip() for element in soup.select(selector)[:MAX_TITLES_PER_SOURCE]]
+    
+    async def _attempt_web_scraping(self, query: str, max_results: int) -> List[Dict]:
         """Attempt to scrape speakers from web sources."""
         speakers = []
         
         try:
-            # Try a simple search approach
-            search_url = f"https://www.google.com/search?q={query.replace(' ', '+')}+speaker+expert"
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
-            }
+            # Query every source at once instead of one after another
+            semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+            session = await self._get_http_session()
+            pages = await asyncio.gather(
+                *(self._fetch_source(session, semaphore, source, query) for source in SEARCH_SOURCES),
+                return_exceptions=True
+            )
+            
+            # Parse off the event loop; html.parser is CPU-bound
+            loop = asyncio.get_running_loop()
+            fetched = [(source, html) for source, html in zip(SEARCH_SOURCES, pages) if isinstance(html, str) and html]
+            parsed = await asyncio.gather(
+                *(loop.run_in_executor(None, self._parse_titles, html, source["selector"]) for source, html in fetched)
+            )
+            
+            # Keep the first max_results meaningful titles, then build one mock speaker per title
+            results = [
+                (source["name"], title)
+                for (source, _), titles in zip(fetched, parsed)
+                for title in titles
+                if title and len(title) > 10
+            ][:max_results]
+            speakers = [
+                {
+                    "name": f"Speaker {number}",
+                    "title": title[:100],
+                    "location": "Web Search",
+                    "source": source_name,
+                    "query": query,
+                    "expertise": query
+                }
+                for number, (source_name, title) in enumerate(results, 1)
+            ]
             
-            response = requests.get(search_url, headers=headers, timeout=10)
-            if response.status_code == 200:
-                soup = BeautifulSoup(response.content, 'html.parser')
-                
-                # Look for any potential speaker information
-                # This is a simplified approach
-                potential_speakers = soup.find_all("h3")[:10]
-                
-                for i, element in enumerate(potential_speakers):
-                    if len(speakers) >= max_results:
-                        break
-                    
-                    title = element.text.strip()
-                    if title and len(title) > 10:
-                        # Create a mock speaker from the search result
-                        speakers.append({
-                            "name": f"Speaker {i+1}",
-                            "title": title[:100],
-                            "location": "Web Search",
-                            "source": "Google Search",
-                            "query": query,
-                            "expertise": query
-                        })
-                
-                time.sleep(2)  # Be respectful
-                
         except Exception as e:
-            print(f"Web scraping error: {e}")
+            logger.warning("Web scraping error: %s", e)
         
         return speakers
     
     def _get_demo_speakers(self, query: str, max_results: int) -> List[Dict]:
         """Get demo speakers based on the query."""
-        # Find the best matching demo category
+        if query in self.demo_speakers:
+            return self.demo_speakers[query][:max_results]
+        
+        # Find the best matching demo category, touching only categories that share a token
         best_match = None
         best_score = 0
+        query_words = frozenset(query.lower().split())
+        overlaps = Counter()
+        for token in query_words:
+            overlaps.update(self._demo_index.get(token, ()))
         
-        for category in self.demo_speakers.keys():
-            # Simple similarity scoring
-            query_words = set(query.lower().split())
-            category_words = set(category.lower().split())
-            intersection = query_words.intersection(category_words)
-            score = len(intersection) / max(len(query_words), len(category_words))
+        for category, overlap in overlaps.items():
+            # Simple similarity scoring; ties go to the category declared first
+            score = overlap / max(len(query_words), self._demo_sizes[category])
             
-            if score > best_score:
+            if score > best_score or (score == best_score and self._demo_order[category] < self._demo_order[best_match]):
                 best_score = score
                 best_match = category
         
@@ -166,147 +360,162 @@ class RobustSpeakerSourcingAgent:
     
     def create_speakers_spreadsheet(self, speakers: List[Dict], title: str = "Hackathon Speakers") -> str:
         """Create a Google Sheets spreadsheet with speaker information."""
+        from googleapiclient.errors import HttpError
+        
         try:
-            print(f"📊 Creating Google Sheets spreadsheet...")
+            logger.info("📊 Creating Google Sheets spreadsheet...")
             
             # Create new spreadsheet
             body = {"properties": {"title": title}}
-            spreadsheet = self.sheets_service.spreadsheets().create(body=body).execute()
+            spreadsheet = self._execute_create(self.sheets_service.spreadsheets().create(body=body))
             spreadsheet_id = spreadsheet["spreadsheetId"]
             
-            # Prepare data for writing
-            headers = ["Name", "Title", "Location", "Source", "Query", "Expertise", "Contact Status", "Notes", "Last Updated"]
-            data = [headers]
-            
-            current_time = time.strftime("%Y-%m-%d %H:%M:%S")
-            for speaker in speakers:
-                row = [
-                    speaker.get("name", ""),
-                    speaker.get("title", ""),
-                    speaker.get("location", ""),
-                    speaker.get("source", ""),
-                    speaker.get("query", ""),
-                    speaker.get("expertise", ""),
-                    "Not Contacted",  # Default status
-                    "",  # Notes column
-                    current_time  # Last updated
-                ]
-                data.append(row)
-            
-            # Write data to sheet
-            range_name = "Sheet1!A1:I" + str(len(data))
-            body = {"values": data}
+            # Last updated: one typed date-time cell shared by every row
+            serial = (datetime.now() - SHEETS_EPOCH).total_seconds() / 86400
+            last_updated = {
+                "userEnteredValue": {"numberValue": serial},
+                "userEnteredFormat": {"numberFormat": {"type": "DATE_TIME"}}
+            }
+            # Contact Status and Notes start out the same for every speaker
+            trailing_cells = [
+                {"userEnteredValue": {"stringValue": "Not Contacted"}},
+                {"userEnteredValue": {"stringValue": ""}},
+                last_updated
+            ]
             
-            self.sheets_service.spreadsheets().values().update(
-                spreadsheetId=spreadsheet_id,
-                range=range_name,
-                valueInputOption="RAW",
-                body=body
-            ).execute()
+            # Build the grid straight from the speakers, without an intermediate value table
+            rows = [{"values": [{"userEnteredValue": {"stringValue": header}} for header in SHEET_HEADERS]}]
+            rows += [
+                {"values": [{"userEnteredValue": {"stringValue": str(speaker.get(key, ""))}} for key in SPEAKER_COLUMNS] + trailing_cells}
+                for speaker in speakers
+            ]
             
-            # Format headers and make it look professional
-            self._format_spreadsheet(spreadsheet_id)
+            # Write data and apply formatting in a single batchUpdate round trip
+            write_data = {
+                "updateCells": {
+                    "start": {"sheetId": 0, "rowIndex": 0, "columnIndex": 0},
+                    "rows": rows,
+                    "fields": "userEnteredValue,userEnteredFormat.numberFormat"
+                }
+            }
+            try:
+                self._chunked_batch_update(spreadsheet_id, [write_data] + self._format_requests())
+            except HttpError as e:
+                # batchUpdate is all-or-nothing; formatting is cosmetic, so retry with just the data
+                logger.warning("⚠️  Error formatting spreadsheet: %s", e)
+                self._chunked_batch_update(spreadsheet_id, [write_data])
             
-            print(f"✅ Spreadsheet created successfully!")
+            logger.info("✅ Spreadsheet created successfully!")
             return spreadsheet_id
             
         except HttpError as e:
-            print(f"❌ Error creating spreadsheet: {e}")
+            logger.error("❌ Error creating spreadsheet: %s", e)
             return None
     
-    def _format_spreadsheet(self, spreadsheet_id: str):
-        """Format the spreadsheet to make it look professional."""
-        try:
-            requests = [
-                # Format headers
-                {
-                    "repeatCell": {
-                        "range": {
-                            "sheetId": 0,
-                            "startRowIndex": 0,
-                            "endRowIndex": 1
-                        },
-                        "cell": {
-                            "userEnteredFormat": {
-                                "backgroundColor": {"red": 0.2, "green": 0.6, "blue": 0.9},
-                                "textFormat": {"bold": True, "foregroundColor": {"red": 1, "green": 1, "blue": 1}}
-                            }
-                        },
-                        "fields": "userEnteredFormat(backgroundColor,textFormat)"
-                    }
-                },
-                # Auto-resize columns
-                {
-                    "autoResizeDimensions": {
-                        "dimensions": {
-                            "sheetId": 0,
-                            "dimension": "COLUMNS",
-                            "startIndex": 0,
-                            "endIndex": 9
+    @retry(retry=retry_if_exception(_is_retryable_api_error), wait=_api_retry_wait, stop=stop_after_attempt(6), reraise=True)
+    def _execute(self, request):
+        """Execute an idempotent Google API request, retrying 429/5xx responses."""
+        return request.execute()
+    
+    @retry(retry=retry_if_exception(_is_rate_limited_api_error), wait=_api_retry_wait, stop=stop_after_attempt(6), reraise=True)
+    def _execute_create(self, request):
+        """Execute a non-idempotent create; a 5xx may follow a commit, so retrying could duplicate it."""
+        return request.execute()
+    
+    def _chunked_batch_update(self, spreadsheet_id: str, requests: List[Dict], chunk: int = MAX_BATCH_REQUESTS) -> List[Dict]:
+        """Send batchUpdate requests in slices of at most `chunk`, returning every reply."""
+        replies = []
+        for start in range(0, len(requests), chunk):
+            response = self._execute(self.sheets_service.spreadsheets().batchUpdate(
+                spreadsheetId=spreadsheet_id,
+                body={"requests": requests[start:start + chunk]}
+            ))
+            replies.extend(response.get("replies", []))
+        return replies
+    
+    def _format_requests(self) -> List[Dict]:
+        """Build the batchUpdate requests that make the spreadsheet look professional."""
+        return [
+            # Format headers
+            {
+                "repeatCell": {
+                    "range": {
+                        "sheetId": 0,
+                        "startRowIndex": 0,
+                        "endRowIndex": 1
+                    },
+                    "cell": {
+                        "userEnteredFormat": {
+                            "backgroundColor": {"red": 0.2, "green": 0.6, "blue": 0.9},
+                            "textFormat": {"bold": True, "foregroundColor": {"red": 1, "green": 1, "blue": 1}}
                         }
-                    }
-                },
-                # Add borders to data
-                {
-                    "updateBorders": {
-                        "range": {
-                            "sheetId": 0,
-                            "startRowIndex": 0,
-                            "endRowIndex": 100,
-                            "startColumnIndex": 0,
-                            "endColumnIndex": 9
-                        },
-                        "top": {"style": "SOLID"},
-                        "bottom": {"style": "SOLID"},
-                        "left": {"style": "SOLID"},
-                        "right": {"style": "SOLID"}
+                    },
+                    "fields": "userEnteredFormat(backgroundColor,textFormat)"
+                }
+            },
+            # Auto-resize columns
+            {
+                "autoResizeDimensions": {
+                    "dimensions": {
+                        "sheetId": 0,
+                        "dimension": "COLUMNS",
+                        "startIndex": 0,
+                        "endIndex": 9
                     }
                 }
-            ]
-            
-            body = {"requests": requests}
-            self.sheets_service.spreadsheets().batchUpdate(
-                spreadsheetId=spreadsheet_id,
-                body=body
-            ).execute()
-            
-        except Exception as e:
-            print(f"⚠️  Error formatting spreadsheet: {e}")
+            },
+            # Add borders to data
+            {
+                "updateBorders": {
+                    "range": {
+                        "sheetId": 0,
+                        "startRowIndex": 0,
+                        "endRowIndex": 100,
+                        "startColumnIndex": 0,
+                        "endColumnIndex": 9
+                    },
+                    "top": {"style": "SOLID"},
+                    "bottom": {"style": "SOLID"},
+                    "left": {"style": "SOLID"},
+                    "right": {"style": "SOLID"}
+                }
+            }
+        ]
     
     def search_and_create_sheet(self, requirements: str, max_results: int = 20) -> Optional[str]:
         """Main method: search for speakers and create Google Sheets."""
-        print(f"🚀 Starting speaker search for: '{requirements}'")
-        print(f"📈 Target: {max_results} speakers")
-        print("-" * 50)
+        logger.info("🚀 Starting speaker search for: '%s'", requirements)
+        logger.info("📈 Target: %d speakers", max_results)
+        logger.info(SEPARATOR)
         
         # Search for speakers
         speakers = self.search_speakers_web(requirements, max_results)
         
         if not speakers:
-            print("❌ No speakers found from any source.")
+            logger.warning("❌ No speakers found from any source.")
             return None
         
-        print(f"\n🎯 Found {len(speakers)} potential speakers!")
-        print("-" * 50)
+        logger.info("\n🎯 Found %d potential speakers!", len(speakers))
+        logger.info(SEPARATOR)
         
         # Show summary of found speakers
         for i, speaker in enumerate(speakers[:5], 1):  # Show first 5
-            print(f"{i}. {speaker['name']} - {speaker['title'][:50]}...")
+            logger.info("%d. %s - %.50s...", i, speaker["name"], speaker["title"])
         
         if len(speakers) > 5:
-            print(f"... and {len(speakers) - 5} more")
+            logger.info("... and %d more", len(speakers) - 5)
         
-        print("-" * 50)
+        logger.info(SEPARATOR)
         
         # Create Google Sheets
         spreadsheet_id = self.create_speakers_spreadsheet(speakers, f"Speakers - {requirements}")
         
         if spreadsheet_id:
             spreadsheet_url = f"https://docs.google.com/spreadsheets/d/{spreadsheet_id}/edit"
-            print(f"🔗 Spreadsheet URL: {spreadsheet_url}")
+            logger.info("🔗 Spreadsheet URL: %s", spreadsheet_url)
             return spreadsheet_url
         else:
-            print("❌ Failed to create spreadsheet")
+            logger.error("❌ Failed to create spreadsheet")
             return None
 
 
@@ -317,6 +526,7 @@ def main():
     parser.add_argument("--interactive", action="store_true", help="Interactive mode for testing")
     
     args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     
     if args.interactive:
         requirements = input("Enter speaker requirements: ")
@@ -330,18 +540,20 @@ def main():
     try:
         spreadsheet_url = agent.search_and_create_sheet(requirements, max_results)
         if spreadsheet_url:
-            print(f"\n🎉 SUCCESS! Your speakers spreadsheet is ready!")
-            print(f"📋 View and manage your speakers here: {spreadsheet_url}")
-            print(f"\n💡 Tips:")
-            print(f"   • Use the 'Contact Status' column to track outreach progress")
-            print(f"   • Add notes in the 'Notes' column for follow-up actions")
-            print(f"   • The spreadsheet auto-updates with timestamps")
+            logger.info("\n🎉 SUCCESS! Your speakers spreadsheet is ready!")
+            logger.info("📋 View and manage your speakers here: %s", spreadsheet_url)
+            logger.info("\n💡 Tips:")
+            logger.info("   • Use the 'Contact Status' column to track outreach progress")
+            logger.info("   • Add notes in the 'Notes' column for follow-up actions")
+            logger.info("   • The spreadsheet auto-updates with timestamps")
         else:
-            print("❌ Failed to create spreadsheet")
+            logger.error("❌ Failed to create spreadsheet")
     except KeyboardInterrupt:
-        print("\n⚠️  Search interrupted by user")
+        logger.warning("\n⚠️  Search interrupted by user")
     except Exception as e:
-        print(f"❌ Unexpected error: {e}")
+        logger.error("❌ Unexpected error: %s", e)
+    finally:
+        agent.close()
 
 
 if __name__ == "__main__":
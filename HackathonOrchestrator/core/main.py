@@ -1,21 +1,38 @@
+import asyncio
 import os
-import time
-from typing import Callable, List, Optional
+from types import MappingProxyType
+from typing import Callable, Final, Mapping, Optional, Sequence, Tuple
 from dotenv import load_dotenv
 
+try:
+    import uvloop
+except ImportError:  # Not available on Windows; the stock asyncio loop is used instead
+    uvloop = None
+
 
 load_dotenv()
 
+# Candidates reported by the dummy run; read-only so every run can share them
+_MOCK_RESULTS: Final[Tuple[Mapping[str, str], ...]] = tuple(MappingProxyType(candidate) for candidate in (
+    {"name": "Dr. Evelyn Reed", "email": "e.reed@example.com", "expertise": "Quantum Computing", "status": "Sourced"},
+    {"name": "Marco Jin", "email": "m.jin@example.com", "expertise": "AI in FinTech", "status": "Sourced"},
+    {"name": "Anya Sharma", "email": "a.sharma@example.com", "expertise": "Decentralized Science", "status": "Sourced"},
+))
+
 
 # --- Main Execution ---
 
-def run_orchestrator(
+async def run_orchestrator_async(
     topic: str = "AI in FinTech",
     on_log: Optional[Callable[[str], None]] = None,
-    on_candidates_found: Optional[Callable[[List[dict]], None]] = None,
+    on_candidates_found: Optional[Callable[[Sequence[Mapping[str, str]]], None]] = None,
     on_candidate_status: Optional[Callable[[int, str], None]] = None,
     simulate_timing: bool = False,
 ) -> None:
+    async def pause(seconds: float) -> None:
+        if simulate_timing:
+            await asyncio.sleep(seconds)
+
     def log(message: str) -> None:
         print(message)
         if on_log:
@@ -24,89 +41,85 @@ def run_orchestrator(
             except Exception:
                 pass
 
+    def report_status(index: int, status: str) -> None:
+        if on_candidate_status:
+            try:
+                on_candidate_status(index, status)
+            except Exception:
+                pass
+
     log(f"--- Launching Orchestrator for topic: {topic} ---")
 
     # Offline simulation mode to avoid external LLM calls
     dummy_run = os.getenv("DUMMY_RUN", "0") == "1" or not os.getenv("OPENAI_API_KEY")
     if dummy_run:
         log("Running in DUMMY mode (no external LLM calls).")
-        if simulate_timing:
-            time.sleep(1)
+        await pause(1)
         log("[SourcingAgent] Starting search...")
-        if simulate_timing:
-            time.sleep(1.2)
-        mock_results = [
-            {"name": "Dr. Evelyn Reed", "email": "e.reed@example.com", "expertise": "Quantum Computing", "status": "Sourced"},
-            {"name": "Marco Jin", "email": "m.jin@example.com", "expertise": "AI in FinTech", "status": "Sourced"},
-            {"name": "Anya Sharma", "email": "a.sharma@example.com", "expertise": "Decentralized Science", "status": "Sourced"},
-        ]
-        log("[SourcingAgent] Found 3 potential candidates.")
+        await pause(1.2)
+        log(f"[SourcingAgent] Found {len(_MOCK_RESULTS)} potential candidates.")
         if on_candidates_found:
+            # Read-only mappings; callbacks that need to mutate or serialize copy them
             try:
-                on_candidates_found(mock_results)
+                on_candidates_found(_MOCK_RESULTS)
             except Exception:
                 pass
-        if simulate_timing:
-            time.sleep(0.6)
+        await pause(0.6)
         log("[SourcingAgent] Task complete. Passing results to SchedulingAgent.")
-        if simulate_timing:
-            time.sleep(1.0)
+        await pause(1.0)
         log("[SchedulingAgent] Initializing outreach sequence...")
-        if simulate_timing:
-            time.sleep(1.2)
-        # Outreach updates
-        for idx, candidate in enumerate(mock_results):
+        await pause(1.2)
+        # Outreach updates, one candidate at a time so the demo shows each send
+        for idx, candidate in enumerate(_MOCK_RESULTS):
             log(f"[SchedulingAgent] Sending outreach email to {candidate['name']}.")
-            if on_candidate_status:
-                try:
-                    on_candidate_status(idx, "Contacted")
-                except Exception:
-                    pass
-            if simulate_timing:
-                time.sleep(0.9)
+            report_status(idx, "Contacted")
+            await pause(0.9)
         # Acceptance
         log("[SchedulingAgent] Received positive reply from Dr. Evelyn Reed. Scheduling meeting.")
-        if on_candidate_status:
-            try:
-                on_candidate_status(0, "Accepted")
-            except Exception:
-                pass
-        if simulate_timing:
-            time.sleep(0.8)
+        report_status(0, "Accepted")
+        await pause(0.8)
         log("[SchedulingAgent] Task complete.")
-        if simulate_timing:
-            time.sleep(0.4)
+        await pause(0.4)
         log("--- Crew Run Complete (Simulated) ---")
         return
 
-    # Import CrewAI-dependent modules only when needed
-    from crewai import Crew, Process
-    from agents import OrchestratorAgents
-    from tasks import OrchestratorTasks
+    def run_crew():
+        # Importing CrewAI, building the crew and kickoff all block, so the whole
+        # thing runs on a worker thread rather than the event loop
+        from crewai import Crew, Process
+        from agents import OrchestratorAgents
+        from tasks import OrchestratorTasks
 
-    agents = OrchestratorAgents()
-    tasks = OrchestratorTasks()
+        agents = OrchestratorAgents()
+        tasks = OrchestratorTasks()
 
-    # Instantiate Agents
-    sourcing_agent = agents.sourcing_agent()
-    scheduling_agent = agents.scheduling_agent()
+        # Instantiate Agents
+        sourcing_agent = agents.sourcing_agent()
+        scheduling_agent = agents.scheduling_agent()
 
-    # Instantiate Tasks
-    source_task = tasks.source_experts_task(sourcing_agent, topic)
-    outreach_task = tasks.outreach_and_schedule_task(scheduling_agent, source_task)
+        # Instantiate Tasks
+        source_task = tasks.source_experts_task(sourcing_agent, topic)
+        outreach_task = tasks.outreach_and_schedule_task(scheduling_agent, source_task)
 
-    # Form the Crew
-    crew = Crew(
-        agents=[sourcing_agent, scheduling_agent],
-        tasks=[source_task, outreach_task],
-        process=Process.sequential,
-        verbose=2,
-    )
+        # Form the Crew
+        crew = Crew(
+            agents=[sourcing_agent, scheduling_agent],
+            tasks=[source_task, outreach_task],
+            process=Process.sequential,
+            verbose=2,
+        )
+        return crew.kickoff()
 
-    result = crew.kickoff()
+    result = await asyncio.to_thread(run_crew)
     log("\n--- Crew Run Complete ---")
     log(str(result))
 
 
+def run_orchestrator(*args, **kwargs) -> None:
+    """Synchronous entry point; runs run_orchestrator_async on a fresh (uvloop, when installed) event loop."""
+    run = uvloop.run if uvloop is not None else asyncio.run
+    run(run_orchestrator_async(*args, **kwargs))
+
+
 if __name__ == "__main__":
     run_orchestrator()
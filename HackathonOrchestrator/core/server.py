@@ -1,11 +1,22 @@
 import asyncio
+import csv
+import hashlib
 import json
-from typing import AsyncIterator, Callable, List, Optional
+import os
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import AsyncIterator, Callable, Dict, Iterator, List, Mapping, Optional, Sequence, Tuple
 from dotenv import load_dotenv
+import anyio
+import orjson
+from aiolimiter import AsyncLimiter
+from tenacity import retry, retry_if_exception, stop_after_attempt, wait_random_exponential
 
 from fastapi import FastAPI, HTTPException, Body
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import StreamingResponse
+from sse_starlette.sse import EventSourceResponse, ServerSentEvent
 
 import sys
 from pathlib import Path
@@ -15,9 +26,26 @@ current_dir = Path(__file__).parent.parent
 if str(current_dir) not in sys.path:
     sys.path.insert(0, str(current_dir))
 
-from core.main import run_orchestrator
+from core.main import run_orchestrator_async
 from services.speaker_finder_service import speaker_finder_service
 
+# Optional dependencies, imported once here instead of inside each request
+try:
+    import httpx
+    from openai import AsyncOpenAI, RateLimitError
+except ImportError:  # GPT personalization is skipped without the openai package
+    AsyncOpenAI = None
+    RateLimitError = None
+
+try:
+    from tools.communication_tools import CommunicationTools  # type: ignore
+    _GOOGLE_IMPORT_ERROR: Optional[ImportError] = None
+except ImportError as e:  # Gmail/Calendar outreach needs the Google client libraries
+    # Kept for the 503 detail: the cause may be a broken install or path, not a missing package
+    CommunicationTools = None
+    _GOOGLE_IMPORT_ERROR = e
+    print(f"⚠️  Gmail/Calendar outreach disabled: {e!r}")
+
 
 load_dotenv()
 
@@ -32,61 +60,225 @@ app.add_middleware(
 )
 
 
+@app.on_event("startup")
+async def size_thread_pools() -> None:
+    """Give blocking OpenAI/Google calls enough worker threads to overlap."""
+    workers = int(os.getenv("THREAD_POOL_SIZE", "64"))
+    asyncio.get_running_loop().set_default_executor(ThreadPoolExecutor(max_workers=workers))
+    # Sync endpoints run on anyio's own limiter, not the loop's executor
+    anyio.to_thread.current_default_thread_limiter().total_tokens = workers
+
+
+# Events buffered per SSE client before the oldest ones are dropped
+SUBSCRIBER_QUEUE_SIZE = 1000
+SSE_PING_SECONDS = 15
+
+
+def _sse_frame(event: str, data: bytes) -> bytes:
+    return b"event: " + event.encode("utf-8") + b"\ndata: " + data + b"\n\n"
+
+
+def _status_key(update: Mapping) -> object:
+    """Identify the candidate a status update is for: email when known, else run index."""
+    return update.get("email", update.get("index"))
+
+
+def _status_updates(event: str, data) -> Optional[dict]:
+    """Map candidate key -> update for status events, so queues can coalesce them."""
+    if event == "candidate_status":
+        return {_status_key(data): data}
+    if event == "candidate_status_batch":
+        return {_status_key(update): update for update in data["updates"]}
+    return None
+
+
+class SubscriberQueue:
+    """Bounded per-client frame buffer that coalesces queued candidate status updates.
+
+    candidate_status and candidate_status_batch frames keep their updates keyed by
+    candidate. A newer status for a candidate still waiting in any queued frame
+    overwrites it in place, so a slow client only ever sees each candidate's latest status.
+    """
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        # Each slot is [payload, event, updates]; updates is None for non-status frames.
+        # Coalescing rewrites slots in place and clears payload so get() re-encodes it.
+        self._slots: deque[list] = deque()
+        self._status_slots: dict[object, list] = {}
+        self._ready = asyncio.Event()
+
+    def put(self, payload: bytes, event: str = "", updates: Optional[dict] = None) -> None:
+        if updates:
+            fresh = {}
+            for key, update in updates.items():
+                slot = self._status_slots.get(key)
+                if slot is None:
+                    fresh[key] = update
+                elif event == "candidate_status" and slot[1] == event:
+                    # Same single-status frame shape: reuse the shared encoding
+                    slot[0] = payload
+                    slot[2][key] = update
+                else:
+                    slot[0] = None
+                    slot[2][key] = update
+            if not fresh:
+                return
+            if len(fresh) < len(updates):
+                # Only the updates not merged into earlier frames are still to be sent
+                payload = None
+            updates = fresh
+        if len(self._slots) >= self.maxsize:
+            # Slow client: drop its oldest event rather than grow without bound
+            self._forget(self._slots.popleft())
+        slot = [payload, event, updates]
+        self._slots.append(slot)
+        if updates:
+            for key in updates:
+                self._status_slots[key] = slot
+        self._ready.set()
+
+    async def get(self) -> bytes:
+        while not self._slots:
+            self._ready.clear()
+            await self._ready.wait()
+        slot = self._slots.popleft()
+        self._forget(slot)
+        if slot[0] is None:
+            _, event, updates = slot
+            if event == "candidate_status":
+                data = next(iter(updates.values()))
+            else:
+                data = {"updates": list(updates.values())}
+            slot[0] = _sse_frame(event, orjson.dumps(data))
+        return slot[0]
+
+    def _forget(self, slot: list) -> None:
+        for key in slot[2] or ():
+            if self._status_slots.get(key) is slot:
+                del self._status_slots[key]
+
+
 class EventBus:
     def __init__(self) -> None:
-        self.queue: asyncio.Queue = asyncio.Queue()
+        # One bounded queue per connected /stream client, so every client sees every event
+        self.subscribers: set[SubscriberQueue] = set()
         self.active_run: bool = False
+        # Strong references to running background flows; the loop only keeps weak ones
+        self.background_tasks: set[asyncio.Task] = set()
+
+    def spawn(self, coro) -> asyncio.Task:
+        """Run a background flow, keeping it referenced until it finishes."""
+        task = asyncio.create_task(coro)
+        self.background_tasks.add(task)
+        task.add_done_callback(self.background_tasks.discard)
+        return task
 
     async def emit(self, event: str, data: dict) -> None:
-        await self.queue.put((event, data))
+        self._emit_sync(event, data)
+
+    async def emit_encoded(self, event: str, data: bytes) -> None:
+        """Emit an event whose data is already JSON-encoded."""
+        self._emit_encoded_sync(event, data)
+
+    def _emit_sync(self, event: str, data: dict) -> None:
+        """Emit without awaiting; must run on the event loop (see loop.call_soon_threadsafe)."""
+        if not self.subscribers:
+            return
+        self._emit_encoded_sync(event, orjson.dumps(data), _status_updates(event, data))
+
+    def _emit_encoded_sync(self, event: str, data: bytes, updates: Optional[dict] = None) -> None:
+        # Encode once; every subscriber shares the same frame
+        payload = _sse_frame(event, data)
+        for queue in self.subscribers:
+            # Each queue may rewrite its own copy while coalescing
+            queue.put(payload, event, dict(updates) if updates else None)
 
     async def sse(self) -> AsyncIterator[bytes]:
+        queue = SubscriberQueue(SUBSCRIBER_QUEUE_SIZE)
+        self.subscribers.add(queue)
         try:
             while True:
-                event, data = await self.queue.get()
-                payload = f"event: {event}\ndata: {json.dumps(data)}\n\n".encode("utf-8")
-                yield payload
+                yield await queue.get()
         except asyncio.CancelledError:
             return
+        finally:
+            self.subscribers.discard(queue)
 
 
 bus = EventBus()
 
 
+@app.on_event("shutdown")
+async def cancel_background_tasks() -> None:
+    """Cancel in-flight runs and outreach flows so shutdown does not leave them dangling."""
+    tasks = list(bus.background_tasks)
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+
 class CandidateStore:
-    """In-memory candidate store for tracking statuses across the flow."""
+    """In-memory candidate store for tracking statuses across the flow.
+
+    Candidates are kept as parallel columns indexed through email_to_idx, so snapshots
+    are built straight from the columns rather than from one dict per candidate. One lock
+    keeps the columns consistent if a worker thread ever touches the store.
+    """
     def __init__(self) -> None:
-        # email -> record
-        self._store: dict[str, dict] = {}
+        self.names: list[Optional[str]] = []
+        self.emails: list[str] = []
+        self.expertise: list[str] = []
+        self.status: list[str] = []
+        self.refs: list[Optional[str]] = []
+        self.email_to_idx: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def _record(self, i: int) -> dict:
+        rec = {"name": self.names[i], "email": self.emails[i], "expertise": self.expertise[i], "status": self.status[i]}
+        if self.refs[i] is not None:
+            rec["refToken"] = self.refs[i]
+        return rec
 
     def load(self, candidates: list[dict]) -> list[dict]:
-        for c in candidates:
-            email = c.get("email")
-            if not email:
-                continue
-            rec = self._store.get(email, {})
-            rec.update({
-                "name": c.get("name") or rec.get("name"),
-                "email": email,
-                "expertise": c.get("expertise") or rec.get("expertise", ""),
-                "status": c.get("status") or rec.get("status", "Sourced"),
-            })
-            self._store[email] = rec
-        return list(self._store.values())
+        with self._lock:
+            for c in candidates:
+                email = c.get("email")
+                if not email:
+                    continue
+                i = self.email_to_idx.get(email)
+                if i is None:
+                    self.email_to_idx[email] = len(self.emails)
+                    self.names.append(c.get("name"))
+                    self.emails.append(email)
+                    self.expertise.append(c.get("expertise") or "")
+                    self.status.append(c.get("status") or "Sourced")
+                    self.refs.append(c.get("refToken"))
+                    continue
+                self.names[i] = c.get("name") or self.names[i]
+                self.expertise[i] = c.get("expertise") or self.expertise[i]
+                self.status[i] = c.get("status") or self.status[i]
+                self.refs[i] = c.get("refToken") or self.refs[i]
+            return [self._record(i) for i in range(len(self.emails))]
 
     def all(self) -> list[dict]:
-        return list(self._store.values())
+        with self._lock:
+            return [self._record(i) for i in range(len(self.emails))]
+
+    def snapshot(self) -> bytes:
+        """The "candidates" event payload, JSON-encoded once straight from the columns."""
+        with self._lock:
+            return orjson.dumps([
+                {"name": name, "email": email, "expertise": expertise, "status": status}
+                for name, email, expertise, status in zip(self.names, self.emails, self.expertise, self.status)
+            ])
 
     def update_status(self, email: str, status: str) -> dict | None:
-        rec = self._store.get(email)
-        if rec is None:
-            return None
-        rec["status"] = status
-        return rec
-
-    def set_ref(self, email: str, ref: str) -> None:
-        if email in self._store:
-            self._store[email]["refToken"] = ref
+        with self._lock:
+            i = self.email_to_idx.get(email)
+            if i is None:
+                return None
+            self.status[i] = status
+            return self._record(i)
 
 
 candidate_store = CandidateStore()
@@ -101,44 +293,40 @@ async def start_run(topic: str) -> dict:
 
     loop = asyncio.get_running_loop()
 
+    # Callbacks may fire from worker threads; hand each event to the loop without a coroutine or Future
     def on_log(message: str) -> None:
-        asyncio.run_coroutine_threadsafe(bus.emit("log", {"message": message}), loop)
+        loop.call_soon_threadsafe(bus._emit_sync, "log", {"message": message})
 
-    def on_candidates_found(cands: List[dict]) -> None:
-        asyncio.run_coroutine_threadsafe(bus.emit("candidates", cands), loop)
+    def on_candidates_found(cands: Sequence[Mapping[str, str]]) -> None:
+        # Copy the read-only candidates into plain dicts so they can be serialized
+        loop.call_soon_threadsafe(bus._emit_sync, "candidates", [dict(c) for c in cands])
 
     def on_candidate_status(index: int, status: str) -> None:
-        asyncio.run_coroutine_threadsafe(
-            bus.emit("candidate_status", {"index": index, "status": status}),
-            loop,
-        )
+        loop.call_soon_threadsafe(bus._emit_sync, "candidate_status", {"index": index, "status": status})
 
-    async def run_in_thread() -> None:
+    async def run_orchestration() -> None:
         try:
-            await loop.run_in_executor(
-                None,
-                lambda: run_orchestrator(
-                    topic=topic,
-                    on_log=on_log,
-                    on_candidates_found=on_candidates_found,
-                    on_candidate_status=on_candidate_status,
-                    simulate_timing=True,
-                ),
+            await run_orchestrator_async(
+                topic=topic,
+                on_log=on_log,
+                on_candidates_found=on_candidates_found,
+                on_candidate_status=on_candidate_status,
+                simulate_timing=True,
             )
         finally:
+            # Let callbacks already queued with call_soon_threadsafe (e.g. the final log line) run first
+            await asyncio.sleep(0)
             await bus.emit("done", {"ok": True})
             bus.active_run = False
 
-    asyncio.create_task(run_in_thread())
+    bus.spawn(run_orchestration())
     return {"status": "started"}
 
 
 @app.get("/stream")
-async def stream_events() -> StreamingResponse:
-    async def gen():
-        async for chunk in bus.sse():
-            yield chunk
-    return StreamingResponse(gen(), media_type="text/event-stream")
+async def stream_events() -> EventSourceResponse:
+    # Frames arrive pre-encoded and pass through untouched; pings keep idle proxies from closing the stream
+    return EventSourceResponse(bus.sse(), ping=SSE_PING_SECONDS)
 
 
 @app.get("/health")
@@ -174,21 +362,67 @@ async def _simulate_outreach_sequence(enriched: List[dict], poll_interval: float
         return
 
 
-def _read_contacts_csv() -> List[dict]:
-    import csv, os
+# Parsed contacts.csv, keyed by the file's mtime so edits are picked up:
+# (mtime, rows, every row's expertise joined for one `in` check)
+_CSV_CACHE: Optional[Tuple[float, List[dict], str]] = None
+
+
+# Shared by every contact row instead of one string per row
+_SOURCED = sys.intern("Sourced")
+
+
+def _clean(value: Optional[str]) -> str:
+    """Strip a CSV cell, skipping the copy for the common already-clean cell."""
+    if not value:
+        return ""
+    if value[0].isspace() or value[-1].isspace():
+        return value.strip()
+    return value
+
+
+def _iter_contacts(f) -> Iterator[dict]:
+    """Yield contact rows with an email as the CSV is read."""
+    for row in csv.DictReader(f):
+        email = _clean(row.get("email"))
+        if not email:
+            continue
+        expertise = _clean(row.get("expertise"))
+        yield {
+            "name": _clean(row.get("name")),
+            "email": email,
+            "expertise": expertise,
+            "status": _SOURCED,
+            "_expertise_lc": expertise.lower(),
+        }
+
+
+def _read_contacts_csv() -> Tuple[List[dict], str]:
+    """Return the contacts.csv rows and their joined expertise, re-parsing only when the file has changed.
+
+    Rows are shared between calls and must not be mutated.
+    """
+    global _CSV_CACHE
     path = os.path.join(os.path.dirname(__file__), "contacts.csv")
-    if not os.path.exists(path):
-        return []
-    out: List[dict] = []
-    with open(path, "r", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            name = (row.get("name") or "").strip()
-            email = (row.get("email") or "").strip()
-            expertise = (row.get("expertise") or "").strip()
-            if email:
-                out.append({"name": name, "email": email, "expertise": expertise, "status": "Sourced"})
-    return out
+    try:
+        mtime = os.stat(path).st_mtime
+    except FileNotFoundError:
+        return [], ""
+    if _CSV_CACHE is not None and _CSV_CACHE[0] == mtime:
+        return _CSV_CACHE[1:]
+    with open(path, "r", encoding="utf-8", newline="") as f:
+        out = list(_iter_contacts(f))
+    expertise_lc = "\n".join(c["_expertise_lc"] for c in out)
+    _CSV_CACHE = (mtime, out, expertise_lc)
+    return _CSV_CACHE[1:]
+
+
+def _filter_contacts(contacts: List[dict], expertise_lc: str, topic: str) -> List[dict]:
+    """Pick contacts whose expertise contains the topic (case-insensitive), else everyone."""
+    t = (topic or "").lower()
+    # One `in` over the joined text rules out a miss without scanning row by row
+    if t not in expertise_lc:
+        return contacts
+    return [c for c in contacts if t in c["_expertise_lc"]] or contacts
 
 
 @app.post("/demo/start-outreach")
@@ -198,39 +432,186 @@ async def demo_start_outreach() -> dict:
         await bus.emit("log", {"message": "[Outreach] No candidates loaded."})
         await bus.emit("done", {"ok": False})
         return {"ok": False, "reason": "no candidates"}
-    asyncio.create_task(_simulate_outreach_sequence(enriched))
+    bus.spawn(_simulate_outreach_sequence(enriched))
     return {"ok": True}
 
 
 @app.get("/demo/run-topic")
 async def demo_run_topic(topic: str) -> dict:
-    """Load candidates from contacts.csv filtered by topic substr and simulate outreach."""
-    all_contacts = _read_contacts_csv()
+    """Load candidates from contacts.csv filtered by topic and simulate outreach."""
+    all_contacts, expertise_lc = await asyncio.to_thread(_read_contacts_csv)
     if not all_contacts:
         await bus.emit("log", {"message": "[SourcingAgent] No contacts.csv found."})
         await bus.emit("done", {"ok": False})
         return {"ok": False, "reason": "no contacts.csv"}
-    # Filter by topic present in expertise (case-insensitive)
-    t = (topic or "").lower()
-    filtered = [c for c in all_contacts if t in (c.get("expertise", "").lower())]
-    if not filtered:
-        filtered = all_contacts  # fallback to all if no match
+    # Filter by topic present in expertise (case-insensitive), falling back to all if no match
+    filtered = _filter_contacts(all_contacts, expertise_lc, topic)
 
     # Load into store and emit candidates
     candidate_store.load(filtered)
     await bus.emit("log", {"message": "[SourcingAgent] Found candidates from CSV."})
-    await bus.emit("candidates", [
-        {"name": r.get("name"), "email": r.get("email"), "expertise": r.get("expertise", ""), "status": r.get("status", "Sourced")}
-        for r in candidate_store.all()
-    ])
+    await bus.emit_encoded("candidates", candidate_store.snapshot())
 
     # Simulate outreach
-    asyncio.create_task(_simulate_outreach_sequence(filtered))
+    bus.spawn(_simulate_outreach_sequence(filtered))
     return {"ok": True, "count": len(filtered)}
 
 
 # --- New Individual Candidate Endpoints ---
 
+# One AsyncOpenAI client (and connection pool) shared by every request; built on first use
+_openai_client = None
+
+OPENAI_MAX_CONNECTIONS = 128
+OPENAI_TIMEOUT = 60.0  # Seconds
+# Caps concurrent completions so bursts queue here instead of tripping rate limits
+_openai_semaphore = asyncio.Semaphore(int(os.getenv("OPENAI_CONCURRENCY", "64")))
+# Requests and tokens per minute allowed by the account tier; requests are paced under
+# these budgets up front instead of relying on RateLimitError retries
+OPENAI_RPM = int(os.getenv("OPENAI_RPM", "3500"))
+OPENAI_TPM = int(os.getenv("OPENAI_TPM", "90000"))
+_openai_rpm_limiter = AsyncLimiter(OPENAI_RPM, time_period=60)
+_openai_tpm_limiter = AsyncLimiter(OPENAI_TPM, time_period=60)
+
+
+def _get_openai_client():
+    """Return the shared AsyncOpenAI client, or None when OPENAI_API_KEY is not set."""
+    global _openai_client
+    if _openai_client is None:
+        api_key = os.getenv("OPENAI_API_KEY")
+        if not api_key or AsyncOpenAI is None:
+            return None
+        # Keep enough pooled keep-alive connections for OPENAI_CONCURRENCY requests in flight
+        http_client = httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=OPENAI_MAX_CONNECTIONS, max_keepalive_connections=OPENAI_MAX_CONNECTIONS),
+            timeout=httpx.Timeout(OPENAI_TIMEOUT, connect=5.0),
+        )
+        _openai_client = AsyncOpenAI(api_key=api_key, http_client=http_client)
+    return _openai_client
+
+
+def _estimate_tokens(kwargs: dict) -> int:
+    """Rough token cost of a completion: ~4 characters per prompt token plus the reply budget."""
+    prompt_chars = sum(len(m.get("content") or "") for m in kwargs.get("messages", ()))
+    return prompt_chars // 4 + kwargs.get("max_tokens", 0)
+
+
+def _is_rate_limited(error: BaseException) -> bool:
+    return RateLimitError is not None and isinstance(error, RateLimitError)
+
+
+@retry(
+    retry=retry_if_exception(_is_rate_limited),
+    wait=wait_random_exponential(multiplier=1, max=20),
+    stop=stop_after_attempt(5),
+    reraise=True,
+)
+async def _chat_completion(client, **kwargs):
+    """chat.completions.create with RPM/TPM pacing, bounded concurrency and backoff on rate limiting."""
+    await _openai_rpm_limiter.acquire()
+    await _openai_tpm_limiter.acquire(min(_estimate_tokens(kwargs), OPENAI_TPM))
+    async with _openai_semaphore:
+        return await client.chat.completions.create(**kwargs)
+
+def _ref(email: str, subject: str) -> str:
+    """Reference token correlating an outreach email with its replies.
+
+    Stable across processes, unlike hash(), so replies can still be checked after a restart.
+    """
+    return hashlib.blake2b(f"{email}\x00{subject}".encode("utf-8"), digest_size=4).hexdigest()
+
+
+def _refs_batch(emails: List[str], subject: str) -> List[str]:
+    """_ref() for many emails sharing one subject, encoding the subject only once."""
+    suffix = b"\x00" + subject.encode("utf-8")
+    return [hashlib.blake2b(email.encode("utf-8") + suffix, digest_size=4).hexdigest() for email in emails]
+
+
+# Recently generated bodies by (name, expertise, template), so repeat sends skip the GPT round-trip
+ENHANCEMENT_CACHE_SIZE = 1024
+_enhancement_cache: "OrderedDict[Tuple[str, str, str], str]" = OrderedDict()
+
+
+def _enhancement_inputs(candidate: dict) -> Tuple[str, str]:
+    """Recipient name and expertise exactly as they go into the prompt, and so into the cache key."""
+    name = (candidate.get("name") or "").strip() or "there"
+    expertise = (candidate.get("expertise") or "").strip() or "technology"
+    return name, expertise
+
+
+def _enhancement_key(candidate: dict, body_template: str) -> Tuple[str, str, str]:
+    return (*_enhancement_inputs(candidate), body_template)
+
+
+def _cached_enhancement(key: Tuple[str, str, str]) -> Optional[str]:
+    body = _enhancement_cache.get(key)
+    if body is not None:
+        _enhancement_cache.move_to_end(key)
+    return body
+
+
+def _store_enhancement(key: Tuple[str, str, str], body: str) -> None:
+    _enhancement_cache[key] = body
+    _enhancement_cache.move_to_end(key)
+    if len(_enhancement_cache) > ENHANCEMENT_CACHE_SIZE:
+        _enhancement_cache.popitem(last=False)
+
+
+# Static instructions live in the system message, so every request shares the same prompt
+# prefix (which OpenAI can cache) and only the per-candidate details are built per call
+_ENHANCE_SYSTEM_MESSAGE = {
+    "role": "system",
+    "content": "You are an expert at writing professional, personalized invitation emails for hackathon speakers and jury members. Make emails warm, specific to their expertise, and compelling. Enhance the template you are given for the named recipient, making it more personalized and engaging while keeping it professional and concise."
+}
+_ANALYZE_SYSTEM_MESSAGE = {
+    "role": "system",
+    "content": "You analyze replies to hackathon speaker invitations. Respond in JSON with keys isPositive (boolean), availableTimes (array of strings) and sentiment (short string)."
+}
+
+
+def _enhance_email_messages(candidate: dict, body_template: str) -> List[dict]:
+    """Chat messages asking GPT to personalize an invitation for one candidate."""
+    name, expertise = _enhancement_inputs(candidate)
+    return [
+        _ENHANCE_SYSTEM_MESSAGE,
+        {
+            "role": "user",
+            "content": f"Recipient: {name}\nExpertise: {expertise}\nTemplate: {body_template}"
+        }
+    ]
+
+
+async def _record_individual_email(candidate: dict, subject: str, body: str) -> dict:
+    """Mark a candidate contacted after an individual email and return the send result."""
+    # Generate reference token
+    ref_token = _ref(candidate["email"], subject)
+    
+    # For demo purposes, simulate email sending
+    # In production, this would integrate with actual email service
+    result = {
+        "ok": True,
+        "to": candidate["email"],
+        "refToken": ref_token,
+        "subject": subject,
+        "body": body,
+        "timestamp": asyncio.get_event_loop().time()
+    }
+    
+    # Update candidate store
+    candidate_store.load([{
+        "name": candidate.get("name"),
+        "email": candidate["email"],
+        "expertise": candidate.get("expertise", ""),
+        "status": "Contacted",
+        "refToken": ref_token
+    }])
+    
+    await bus.emit("log", {"message": f"Enhanced email sent to {candidate.get('name', candidate['email'])}"})
+    await bus.emit("candidate_status", {"email": candidate["email"], "status": "Contacted"})
+    
+    return result
+
+
 @app.post("/outreach/send-individual")
 async def send_individual_email(payload: dict = Body(...)) -> dict:
     """Send email to a single candidate with GPT-generated personalized content."""
@@ -242,78 +623,190 @@ async def send_individual_email(payload: dict = Body(...)) -> dict:
         raise HTTPException(status_code=400, detail="candidate email required")
     
     try:
-        # Import OpenAI for content enhancement
-        import openai
-        import os
-        from dotenv import load_dotenv
-        
-        load_dotenv()
-        openai.api_key = os.getenv("OPENAI_API_KEY")
+        client = _get_openai_client()
+        cache_key = _enhancement_key(candidate, body_template)
+        enhanced_body = _cached_enhancement(cache_key)
         
-        # Generate personalized email using GPT
-        if openai.api_key:
+        # Generate personalized email using GPT, unless this exact one was generated recently
+        if enhanced_body is None and client:
             try:
-                client = openai.OpenAI(api_key=openai.api_key)
-                response = client.chat.completions.create(
+                response = await _chat_completion(
+                    client,
                     model="gpt-3.5-turbo",
-                    messages=[
-                        {
-                            "role": "system",
-                            "content": "You are an expert at writing professional, personalized invitation emails for hackathon speakers and jury members. Make emails warm, specific to their expertise, and compelling."
-                        },
-                        {
-                            "role": "user",
-                            "content": f"""
-                            Please enhance this email template for {candidate.get('name', 'there')} who has expertise in {candidate.get('expertise', 'technology')}:
-                            
-                            Template: {body_template}
-                            
-                            Make it more personalized and engaging while keeping it professional and concise.
-                            """
-                        }
-                    ],
+                    messages=_enhance_email_messages(candidate, body_template),
                     max_tokens=500,
                     temperature=0.7
                 )
                 enhanced_body = response.choices[0].message.content.strip()
+                _store_enhancement(cache_key, enhanced_body)
             except Exception as e:
                 print(f"GPT enhancement failed: {e}")
                 enhanced_body = body_template.format(name=candidate.get('name', 'there'))
-        else:
+        elif enhanced_body is None:
             enhanced_body = body_template.format(name=candidate.get('name', 'there'))
         
-        # Generate reference token
-        ref_token = f"{hash((candidate['email'], subject)) & 0xfffffff:x}"
-        
-        # For demo purposes, simulate email sending
-        # In production, this would integrate with actual email service
-        result = {
-            "ok": True,
-            "to": candidate["email"],
-            "refToken": ref_token,
-            "subject": subject,
-            "body": enhanced_body,
-            "timestamp": asyncio.get_event_loop().time()
-        }
-        
-        # Update candidate store
-        candidate_store.load([{
-            "name": candidate.get("name"),
-            "email": candidate["email"],
-            "expertise": candidate.get("expertise", ""),
-            "status": "Contacted"
-        }])
-        candidate_store.set_ref(candidate["email"], ref_token)
-        
-        await bus.emit("log", {"message": f"Enhanced email sent to {candidate.get('name', candidate['email'])}"})
-        await bus.emit("candidate_status", {"email": candidate["email"], "status": "Contacted"})
-        
-        return result
+        return await _record_individual_email(candidate, subject, enhanced_body)
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to send email: {str(e)}")
 
 
+@app.post("/outreach/send-individual/stream")
+async def stream_individual_email(payload: dict = Body(...)) -> EventSourceResponse:
+    """Like /outreach/send-individual, but streams the GPT-written body as it is generated.
+
+    Emits "token" events carrying body fragments, then one "done" event with the send result.
+    If generation fails partway, a "reset" event tells the client to discard the fragments
+    shown so far; the plain template follows as a single "token" and is what gets sent.
+    """
+    candidate = payload.get("candidate", {})
+    subject = payload.get("subject", "Hackathon Invitation")
+    body_template = payload.get("bodyTemplate", "Hi {name}, we'd love to invite you.")
+    
+    if not candidate.get("email"):
+        raise HTTPException(status_code=400, detail="candidate email required")
+    
+    async def gen():
+        client = _get_openai_client()
+        cache_key = _enhancement_key(candidate, body_template)
+        parts: List[str] = []
+        cached_body = _cached_enhancement(cache_key)
+        if cached_body is not None:
+            parts.append(cached_body)
+            yield ServerSentEvent(event="token", data=cached_body)
+        elif client:
+            stream = None
+            try:
+                stream = await _chat_completion(
+                    client,
+                    model="gpt-3.5-turbo",
+                    messages=_enhance_email_messages(candidate, body_template),
+                    max_tokens=500,
+                    temperature=0.7,
+                    stream=True
+                )
+                async for chunk in stream:
+                    delta = chunk.choices[0].delta.content if chunk.choices else None
+                    if delta:
+                        parts.append(delta)
+                        yield ServerSentEvent(event="token", data=delta)
+                if parts:
+                    _store_enhancement(cache_key, "".join(parts).strip())
+            except Exception as e:
+                print(f"GPT enhancement failed: {e}")
+                if parts:
+                    # Never send a truncated body; fall back to the template below
+                    parts.clear()
+                    yield ServerSentEvent(event="reset", data="")
+            finally:
+                # Also runs when the client disconnects, releasing the upstream connection
+                if stream is not None:
+                    await stream.close()
+        if parts:
+            enhanced_body = "".join(parts).strip()
+        else:
+            # No GPT or it failed: send the plain template in one piece
+            enhanced_body = body_template.format(name=candidate.get('name', 'there'))
+            yield ServerSentEvent(event="token", data=enhanced_body)
+        result = await _record_individual_email(candidate, subject, enhanced_body)
+        yield ServerSentEvent(event="done", data=orjson.dumps(result).decode("utf-8"))
+    
+    return EventSourceResponse(gen())
+
+
+# Canned replies returned by /outreach/check-response; the ref token picks one
+_SIM_RESPONSES = (
+    {
+        "text": "Hi! Yes, I'm very interested in participating. I'm available on Tuesday 2-4 PM, Wednesday 10 AM-12 PM, or Friday 3-5 PM next week.",
+        "isPositive": True,
+        "times": ["Tuesday 2-4 PM", "Wednesday 10 AM-12 PM", "Friday 3-5 PM"]
+    },
+    {
+        "text": "Thanks for reaching out! I'd love to be involved. I can do Monday 1-3 PM, Thursday 9-11 AM, or next Friday afternoon.",
+        "isPositive": True,
+        "times": ["Monday 1-3 PM", "Thursday 9-11 AM", "Friday 2-4 PM"]
+    },
+    {
+        "text": "Thank you for the invitation, but I'm not available during that time period. Good luck with your event!",
+        "isPositive": False,
+        "times": []
+    },
+    {
+        "text": "Sounds interesting! I'm available most weekday afternoons. How about Wednesday 2 PM or Thursday 3 PM?",
+        "isPositive": True,
+        "times": ["Wednesday 2 PM", "Thursday 3 PM"]
+    },
+)
+
+
+# GPT analyses by hash of the normalized reply text, so repeated checks of one reply cost one call
+ANALYSIS_CACHE_SIZE = 10_000
+ANALYSIS_CACHE_TTL = 600.0  # Seconds
+_analysis_cache: "OrderedDict[bytes, Tuple[float, dict]]" = OrderedDict()
+_analysis_inflight: Dict[bytes, asyncio.Future] = {}
+
+
+async def _analyze_response(text: str) -> dict:
+    """_gpt_analyze_response() behind a TTL'd LRU; concurrent checks of one reply share a single call."""
+    key = hashlib.blake2b(text.strip().lower().encode("utf-8"), digest_size=16).digest()
+    hit = _analysis_cache.get(key)
+    if hit is not None and time.monotonic() - hit[0] < ANALYSIS_CACHE_TTL:
+        _analysis_cache.move_to_end(key)
+        return hit[1]
+    
+    pending = _analysis_inflight.get(key)
+    if pending is None:
+        pending = _analysis_inflight[key] = asyncio.ensure_future(_gpt_analyze_response(text))
+        pending.add_done_callback(lambda _: _analysis_inflight.pop(key, None))
+    # Shielded so one caller disconnecting does not cancel the call for the others
+    analysis = await asyncio.shield(pending)
+    
+    # Failures come back empty and are retried next time rather than cached
+    if analysis:
+        _analysis_cache[key] = (time.monotonic(), analysis)
+        _analysis_cache.move_to_end(key)
+        if len(_analysis_cache) > ANALYSIS_CACHE_SIZE:
+            _analysis_cache.popitem(last=False)
+    return analysis
+
+
+async def _gpt_analyze_response(text: str) -> dict:
+    """Ask GPT whether a reply is positive and which times it offers.
+
+    Returns only the fields GPT produced with the expected types; empty when GPT is
+    unavailable or fails, so callers fill in their own defaults.
+    """
+    client = _get_openai_client()
+    if not client:
+        return {}
+    try:
+        # JSON mode constrains the model to a single JSON object, so no prose to strip before parsing
+        completion = await _chat_completion(
+            client,
+            model="gpt-3.5-turbo",
+            messages=[_ANALYZE_SYSTEM_MESSAGE, {"role": "user", "content": text}],
+            response_format={"type": "json_object"},
+            max_tokens=200,
+            temperature=0.3
+        )
+        parsed = orjson.loads(completion.choices[0].message.content)
+    except Exception as e:
+        print(f"GPT analysis failed: {e}")
+        return {}
+    
+    if not isinstance(parsed, dict):
+        return {}
+    analysis = {}
+    if isinstance(parsed.get("isPositive"), bool):
+        analysis["isPositive"] = parsed["isPositive"]
+    times = parsed.get("availableTimes")
+    if isinstance(times, list):
+        analysis["availableTimes"] = [str(t) for t in times]
+    if isinstance(parsed.get("sentiment"), str):
+        analysis["sentiment"] = parsed["sentiment"]
+    return analysis
+
+
 @app.post("/outreach/check-response")
 async def check_individual_response(payload: dict = Body(...)) -> dict:
     """Check for response from a specific candidate and analyze it with GPT."""
@@ -326,14 +819,12 @@ async def check_individual_response(payload: dict = Body(...)) -> dict:
     try:
         # Simulate response checking (in production, this would check actual email)
         # For demo, we'll simulate responses for some candidates
-        import random
-        import time
-        
         # Simulate response arrival based on time elapsed
         current_time = time.time()
         
-        # Create a deterministic but seemingly random response pattern
-        response_seed = hash(ref_token) % 100
+        # Create a deterministic but seemingly random response pattern, stable across restarts
+        digest = hashlib.blake2b(ref_token.encode("utf-8"), digest_size=2).digest()
+        response_seed = digest[0] % 100
         time_factor = int(current_time) % 60  # Change response over time
         
         # 30% chance of response after some time
@@ -346,80 +837,20 @@ async def check_individual_response(payload: dict = Body(...)) -> dict:
                 "message": "No response yet"
             }
         
-        # Generate simulated response
-        simulated_responses = [
-            {
-                "text": "Hi! Yes, I'm very interested in participating. I'm available on Tuesday 2-4 PM, Wednesday 10 AM-12 PM, or Friday 3-5 PM next week.",
-                "isPositive": True,
-                "times": ["Tuesday 2-4 PM", "Wednesday 10 AM-12 PM", "Friday 3-5 PM"]
-            },
-            {
-                "text": "Thanks for reaching out! I'd love to be involved. I can do Monday 1-3 PM, Thursday 9-11 AM, or next Friday afternoon.",
-                "isPositive": True,
-                "times": ["Monday 1-3 PM", "Thursday 9-11 AM", "Friday 2-4 PM"]
-            },
-            {
-                "text": "Thank you for the invitation, but I'm not available during that time period. Good luck with your event!",
-                "isPositive": False,
-                "times": []
-            },
-            {
-                "text": "Sounds interesting! I'm available most weekday afternoons. How about Wednesday 2 PM or Thursday 3 PM?",
-                "isPositive": True,
-                "times": ["Wednesday 2 PM", "Thursday 3 PM"]
-            }
-        ]
+        response_data = _SIM_RESPONSES[digest[1] % len(_SIM_RESPONSES)]
         
-        response_data = random.choice(simulated_responses)
-        
-        # Use GPT to analyze response (if available)
-        try:
-            import openai
-            import os
-            
-            openai.api_key = os.getenv("OPENAI_API_KEY")
-            
-            if openai.api_key:
-                client = openai.OpenAI(api_key=openai.api_key)
-                analysis = client.chat.completions.create(
-                    model="gpt-3.5-turbo",
-                    messages=[
-                        {
-                            "role": "system",
-                            "content": "You are an AI that analyzes email responses to speaker invitations. Extract whether the response is positive/negative and any available time slots mentioned."
-                        },
-                        {
-                            "role": "user",
-                            "content": f"""
-                            Analyze this email response to a hackathon speaker invitation:
-                            
-                            "{response_data['text']}"
-                            
-                            Return a JSON with:
-                            1. isPositive: boolean (true if they're interested)
-                            2. availableTimes: array of time slots mentioned
-                            3. sentiment: brief description
-                            """
-                        }
-                    ],
-                    max_tokens=200,
-                    temperature=0.3
-                )
-                
-                # Parse GPT response (simplified for demo)
-                gpt_result = response_data  # Use simulated data as fallback
-                
-        except Exception as e:
-            print(f"GPT analysis failed: {e}")
-            # Use simulated data as fallback
+        # Use GPT to analyze response (if available), falling back to the simulated data
+        analysis = await _analyze_response(response_data["text"])
+        is_positive = analysis.get("isPositive", response_data["isPositive"])
+        available_times = analysis.get("availableTimes", response_data["times"])
         
         return {
             "ok": True,
             "hasResponse": True,
             "responseText": response_data["text"],
-            "isPositive": response_data["isPositive"],
-            "availableTimes": response_data["times"],
-            "sentiment": "positive" if response_data["isPositive"] else "negative"
+            "isPositive": is_positive,
+            "availableTimes": available_times,
+            "sentiment": analysis.get("sentiment") or ("positive" if is_positive else "negative")
         }
         
     except Exception as e:
@@ -475,6 +906,33 @@ async def schedule_individual_meeting(payload: dict = Body(...)) -> dict:
 # Run with: uvicorn server:app --reload
 
 
+async def _emit_status_batch(updates: List[Tuple[str, str]]) -> None:
+    """Report several (email, status) changes as one candidate_status_batch event."""
+    if updates:
+        await bus.emit("candidate_status_batch", {"updates": [{"email": email, "status": status} for email, status in updates]})
+
+
+def _require_google() -> None:
+    """Fail fast when the Gmail/Calendar outreach endpoints cannot work."""
+    if _GOOGLE_IMPORT_ERROR is not None:
+        raise HTTPException(status_code=503, detail=f"Gmail/Calendar outreach is unavailable: {_GOOGLE_IMPORT_ERROR!r}")
+
+
+# Sends in flight at once; keeps bursts under Gmail's per-user rate limits
+GMAIL_SEND_CONCURRENCY = 4
+
+
+def _send_one(candidate: dict, subject: str, body_template: str, ref: str, credentials) -> Tuple[str, dict]:
+    """Send one outreach email tagged with `ref`; returns the ref and the parsed send result."""
+    email = candidate["email"]
+    body = body_template.format(name=candidate.get("name") or "there")
+    res = CommunicationTools.send_email(to=email, subject=subject, body=body, ref_token=ref, credentials=credentials)
+    try:
+        return ref, json.loads(res)
+    except Exception:
+        return ref, {"ok": False, "to": email}
+
+
 @app.post("/outreach/send")
 async def send_outreach(payload: dict = Body(...)) -> dict:
     """Send outreach emails to a provided candidate list.
@@ -491,27 +949,41 @@ async def send_outreach(payload: dict = Body(...)) -> dict:
     candidates: List[dict] = payload.get("candidates") or []
     if not candidates:
         raise HTTPException(status_code=400, detail="candidates required")
+    _require_google()
 
-    # Lazy import to avoid requiring google libs unless endpoints are used
-    from tools.communication_tools import CommunicationTools  # type: ignore
+    # Load (and if needed refresh) the Gmail credentials once, so the senders below
+    # don't each refresh the token or start an OAuth flow and race on token_gmail.json
+    credentials = await asyncio.to_thread(CommunicationTools.gmail_credentials)
+    send_slots = asyncio.Semaphore(GMAIL_SEND_CONCURRENCY)
+
+    async def send(candidate: dict, ref: str) -> Tuple[str, dict]:
+        async with send_slots:
+            return await asyncio.to_thread(_send_one, candidate, subject, body_template, ref, credentials)
+
+    # Send a few emails at a time on the thread pool, then record them in order
+    recipients = [c for c in candidates if c.get("email")]
+    refs = _refs_batch([c["email"] for c in recipients], subject)
+    sent = await asyncio.gather(
+        *(send(c, ref) for c, ref in zip(recipients, refs)),
+        return_exceptions=True,
+    )
 
     results: List[dict] = []
-    for c in candidates:
+    contacted: List[Tuple[str, str]] = []
+    rows: List[dict] = []
+    for c, outcome in zip(recipients, sent):
         name = c.get("name") or "there"
-        email = c.get("email")
-        if not email:
-            continue
-        ref = f"{hash((email, subject)) & 0xfffffff:x}"
-        body = body_template.format(name=name)
-        res = CommunicationTools.send_email(to=email, subject=subject, body=body, ref_token=ref)
-        try:
-            results.append(json.loads(res))
-        except Exception:
+        email = c["email"]
+        if isinstance(outcome, BaseException):
             results.append({"ok": False, "to": email})
-        # Track candidate and status
-        candidate_store.load([{"name": name, "email": email, "status": "Contacted"}])
-        candidate_store.set_ref(email, ref)
-        await bus.emit("candidate_status", {"email": email, "status": "Contacted"})
+            continue
+        ref, res = outcome
+        results.append(res)
+        rows.append({"name": name, "email": email, "status": "Contacted", "refToken": ref})
+        contacted.append((email, "Contacted"))
+    # Track candidates, statuses and refs in one store update
+    candidate_store.load(rows)
+    await _emit_status_batch(contacted)
     return {"ok": True, "sent": results}
 
 
@@ -522,12 +994,9 @@ async def check_replies(payload: dict = Body(...)) -> dict:
     payload example:
     { "refs": ["abc123", "def456"] }
     """
-    from tools.communication_tools import CommunicationTools  # type: ignore
+    _require_google()
     refs: List[str] = payload.get("refs") or []
-    found: dict = {}
-    for ref in refs:
-        msgs = CommunicationTools.search_replies_by_ref_token(ref)
-        found[ref] = msgs
+    found = await asyncio.to_thread(CommunicationTools.search_replies_by_ref_tokens, refs)
     return {"ok": True, "replies": found}
 
 
@@ -540,16 +1009,18 @@ async def schedule_on_reply(payload: dict = Body(...)) -> dict:
     duration: int = int(payload.get("duration", 30))
     timezone_name: Optional[str] = payload.get("timezone")
 
-    from tools.communication_tools import CommunicationTools  # type: ignore
+    _require_google()
     scheduled: List[dict] = []
+    accepted: List[Tuple[str, str]] = []
     for c in candidates:
         email = c.get("email")
         ref = c.get("refToken")
         if not email or not ref:
             continue
-        msgs = CommunicationTools.search_replies_by_ref_token(ref)
+        msgs = await asyncio.to_thread(CommunicationTools.search_replies_by_ref_token, ref)
         if msgs:
-            res = CommunicationTools.schedule_meeting(
+            res = await asyncio.to_thread(
+                CommunicationTools.schedule_meeting,
                 attendees=[email],
                 summary=summary,
                 description=description,
@@ -561,8 +1032,9 @@ async def schedule_on_reply(payload: dict = Body(...)) -> dict:
             except Exception:
                 scheduled.append({"eventId": None, "calendarLink": None, "meetLink": None})
             candidate_store.update_status(email, "Accepted")
-            await bus.emit("candidate_status", {"email": email, "status": "Accepted"})
+            accepted.append((email, "Accepted"))
             await bus.emit("log", {"message": f"[Scheduling] Meeting created for {email}"})
+    await _emit_status_batch(accepted)
     return {"ok": True, "scheduled": scheduled}
 
 
@@ -585,6 +1057,7 @@ async def run_full_outreach_flow(payload: dict = Body(...)) -> dict:
     """
     if bus.active_run:
         raise HTTPException(status_code=409, detail="A run is already in progress")
+    _require_google()
 
     bus.active_run = True
     loop = asyncio.get_running_loop()
@@ -604,42 +1077,49 @@ async def run_full_outreach_flow(payload: dict = Body(...)) -> dict:
             await bus.emit("log", {"message": "[Outreach] Starting outreach flow"})
             # 1) Send emails with ref tokens
             enriched: List[dict] = []
-            for c in candidates:
+            contacted: List[Tuple[str, str]] = []
+            recipients = [c for c in candidates if c.get("email")]
+            refs = _refs_batch([c["email"] for c in recipients], subject)
+            for c, ref in zip(recipients, refs):
                 name = c.get("name") or "there"
-                email = c.get("email")
-                if not email:
-                    continue
-                ref = f"{hash((email, subject)) & 0xfffffff:x}"
+                email = c["email"]
                 body = body_template.format(name=name)
-                from tools.communication_tools import CommunicationTools  # type: ignore
-                res_json = CommunicationTools.send_email(to=email, subject=subject, body=body, ref_token=ref)
+                res_json = await asyncio.to_thread(CommunicationTools.send_email, to=email, subject=subject, body=body, ref_token=ref)
                 try:
                     res = json.loads(res_json)
                 except Exception:
                     res = {"ok": False, "to": email, "refToken": ref}
                 enriched.append({"name": name, "email": email, "refToken": ref, "send": res})
-                candidate_store.load([{"name": name, "email": email, "status": "Contacted"}])
-                candidate_store.set_ref(email, ref)
-                await bus.emit("candidate_status", {"email": email, "status": "Contacted"})
+                contacted.append((email, "Contacted"))
                 await bus.emit("log", {"message": f"[Outreach] Sent to {name} <{email}>"})
+            candidate_store.load([
+                {"name": e["name"], "email": e["email"], "status": "Contacted", "refToken": e["refToken"]}
+                for e in enriched
+            ])
+            await _emit_status_batch(contacted)
 
             await bus.emit("candidates", [
                 {"name": e["name"], "email": e["email"], "expertise": "", "status": "Contacted"}
                 for e in enriched
             ])
 
-            # 2) Poll for replies within window
-            deadline = asyncio.get_event_loop().time() + window_minutes * 60
+            # 2) Poll for replies within window; one Gmail query per tick covers every pending ref
             scheduled: List[dict] = []
-            while asyncio.get_event_loop().time() < deadline:
-                for idx, e in enumerate(enriched):
-                    if e.get("done"):
-                        continue
-                    from tools.communication_tools import CommunicationTools  # type: ignore
-                    msgs = CommunicationTools.search_replies_by_ref_token(e["refToken"])
-                    if msgs:
+            by_ref = {e["refToken"]: e for e in enriched}
+            pending = set(by_ref)
+
+            # The deadline is only checked between ticks, so a tick's meetings and status
+            # updates always finish; stops early once every candidate has replied
+            deadline = loop.time() + window_minutes * 60
+            while pending and loop.time() < deadline:
+                replies = await asyncio.to_thread(CommunicationTools.search_replies_by_ref_tokens, sorted(pending))
+                accepted: List[Tuple[str, str]] = []
+                for ref, msgs in replies.items():
+                    if msgs and ref in pending:
+                        e = by_ref[ref]
                         await bus.emit("log", {"message": f"[Outreach] Reply detected from {e['email']}"})
-                        meet_json = CommunicationTools.schedule_meeting(
+                        meet_json = await asyncio.to_thread(
+                            CommunicationTools.schedule_meeting,
                             attendees=[e["email"]],
                             summary=summary,
                             description=description,
@@ -650,18 +1130,20 @@ async def run_full_outreach_flow(payload: dict = Body(...)) -> dict:
                             meet = json.loads(meet_json)
                         except Exception:
                             meet = {"eventId": None}
-                        e["done"] = True
+                        pending.discard(ref)
                         scheduled.append({"email": e["email"], **meet})
                         candidate_store.update_status(e["email"], "Accepted")
-                        await bus.emit("candidate_status", {"email": e["email"], "status": "Accepted"})
+                        accepted.append((e["email"], "Accepted"))
                         await bus.emit("log", {"message": f"[Scheduling] Meeting created for {e['email']}"})
-                await asyncio.sleep(poll_interval)
+                await _emit_status_batch(accepted)
+                if pending:
+                    await asyncio.sleep(min(poll_interval, max(0.0, deadline - loop.time())))
 
             await bus.emit("done", {"ok": True, "scheduled": scheduled})
         finally:
             bus.active_run = False
 
-    asyncio.create_task(flow_task())
+    bus.spawn(flow_task())
     return {"ok": True, "status": "started"}
 
 
@@ -670,10 +1152,7 @@ async def load_candidates(payload: dict = Body(...)) -> dict:
     """Load or overwrite candidates for tracking. Emits SSE update."""
     candidates: List[dict] = payload.get("candidates") or []
     all_recs = candidate_store.load(candidates)
-    await bus.emit("candidates", [
-        {"name": r.get("name"), "email": r.get("email"), "expertise": r.get("expertise", ""), "status": r.get("status", "Sourced")}
-        for r in all_recs
-    ])
+    await bus.emit_encoded("candidates", candidate_store.snapshot())
     return {"ok": True, "count": len(all_recs)}
 
 
@@ -696,20 +1175,20 @@ async def update_candidate_status(email: str, payload: dict = Body(...)) -> dict
 async def find_speakers(payload: dict = Body(...)) -> dict:
     """Find speakers for a given topic and create Google Sheets."""
     try:
-        topic = payload.get("topic", "")
+        topic = (payload.get("topic") or "").strip()
         max_results = payload.get("max_results", 20)
         
         if not topic:
             raise HTTPException(status_code=400, detail="Topic is required")
         
         # Get speakers data first
-        speakers = speaker_finder_service.search_speakers(topic, max_results)
+        speakers = await asyncio.to_thread(speaker_finder_service.search_speakers, topic, max_results)
         
         if not speakers:
             raise HTTPException(status_code=404, detail="No speakers found for this topic")
         
-        # Create spreadsheet
-        spreadsheet_url = speaker_finder_service.find_and_create_sheet(topic, max_results)
+        # Create spreadsheet from the speakers already found instead of searching again
+        spreadsheet_url = await asyncio.to_thread(speaker_finder_service.find_and_create_sheet, topic, max_results, speakers)
         
         if spreadsheet_url:
             return {
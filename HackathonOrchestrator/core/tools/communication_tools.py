@@ -1,8 +1,9 @@
 import base64
 import json
 import os
+import re
 from datetime import datetime, timedelta, timezone
-from typing import List, Optional
+from typing import Dict, List, Optional
 from uuid import uuid4
 
 from email.message import EmailMessage
@@ -28,6 +29,10 @@ CAL_SCOPES = ["https://www.googleapis.com/auth/calendar.events"]
 CREDENTIALS_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), "credentials.json")
 TOKEN_GMAIL = os.path.join(os.path.dirname(os.path.dirname(__file__)), "token_gmail.json")
 TOKEN_CAL = os.path.join(os.path.dirname(os.path.dirname(__file__)), "token_calendar.json")
+# Reference token that send_email appends to outbound subjects
+REF_TOKEN_PATTERN = re.compile(r"Ref:(\w+)")
+# Gmail accepts at most this many calls in one batch request
+GMAIL_BATCH_LIMIT = 100
 
 
 def _load_credentials(scopes: List[str], token_path: str) -> Credentials:
@@ -54,8 +59,9 @@ def _load_credentials(scopes: List[str], token_path: str) -> Credentials:
     return creds
 
 
-def _get_gmail_service():
-    creds = _load_credentials(GMAIL_SCOPES, TOKEN_GMAIL)
+def _get_gmail_service(creds: Optional[Credentials] = None):
+    if creds is None:
+        creds = _load_credentials(GMAIL_SCOPES, TOKEN_GMAIL)
     return build("gmail", "v1", credentials=creds)
 
 
@@ -66,14 +72,25 @@ def _get_calendar_service():
 
 class CommunicationTools:
     @staticmethod
-    def send_email(to: str, subject: str, body: str, *, ref_token: Optional[str] = None) -> str:
+    def gmail_credentials() -> Credentials:
+        """Load (refreshing or authorizing if needed) the Gmail credentials once.
+
+        Pass the result to send_email when sending from several threads, so they don't
+        each refresh the token or start an OAuth flow and race to write token_gmail.json.
+        """
+        return _load_credentials(GMAIL_SCOPES, TOKEN_GMAIL)
+
+    @staticmethod
+    def send_email(
+        to: str, subject: str, body: str, *, ref_token: Optional[str] = None, credentials: Optional[Credentials] = None
+    ) -> str:
         """Send an email using Gmail API.
 
         Requires credentials.json and first-time OAuth authorization.
         Uses env SENDER_EMAIL for From, falling back to the authenticated account.
         """
         try:
-            service = _get_gmail_service()
+            service = _get_gmail_service(credentials)
 
             message = EmailMessage()
             sender = os.getenv("SENDER_EMAIL", "me")
@@ -198,6 +215,60 @@ class CommunicationTools:
         resp = service.users().messages().list(userId="me", q=q, maxResults=50).execute()
         return resp.get("messages", []) or []
 
+    @staticmethod
+    def search_replies_by_ref_tokens(
+        ref_tokens: List[str], sender_email: Optional[str] = None, newer_than_days: int = 14
+    ) -> Dict[str, List[dict]]:
+        """Search for replies to many reference tokens with a single Gmail query.
+
+        Subjects of the matches are fetched in one batch request and used to attribute each
+        message to its token. Returns a dict mapping every token to its (possibly empty) list
+        of message metadata dicts.
+        """
+        found: Dict[str, List[dict]] = {ref: [] for ref in ref_tokens}
+        if not ref_tokens:
+            return found
+        service = _get_gmail_service()
+        sender = sender_email or os.getenv("SENDER_EMAIL")
+        refs_clause = " OR ".join(f"subject:Ref:{ref}" for ref in ref_tokens)
+        q_parts = [f"({refs_clause})", f"newer_than:{int(newer_than_days)}d"]
+        if sender:
+            q_parts.append(f"-from:{sender}")
+        q = " ".join(q_parts)
+        # One list page holds at most 500 ids; follow nextPageToken so no reply is dropped
+        messages: List[dict] = []
+        page_token: Optional[str] = None
+        while True:
+            resp = service.users().messages().list(
+                userId="me", q=q, maxResults=500, pageToken=page_token
+            ).execute()
+            messages.extend(resp.get("messages", []) or [])
+            page_token = resp.get("nextPageToken")
+            if not page_token:
+                break
+        if not messages:
+            return found
+
+        def attribute(request_id, response, exception):
+            if exception is not None:
+                return
+            headers = response.get("payload", {}).get("headers", [])
+            subject = next((h.get("value", "") for h in headers if h.get("name", "").lower() == "subject"), "")
+            match = REF_TOKEN_PATTERN.search(subject)
+            if match and match.group(1) in found:
+                found[match.group(1)].append({"id": response.get("id"), "threadId": response.get("threadId")})
+
+        for start in range(0, len(messages), GMAIL_BATCH_LIMIT):
+            batch = service.new_batch_http_request(callback=attribute)
+            for message in messages[start:start + GMAIL_BATCH_LIMIT]:
+                batch.add(
+                    service.users().messages().get(
+                        userId="me", id=message["id"], format="metadata", metadataHeaders=["Subject"]
+                    )
+                )
+            batch.execute()
+        return found
+
 
 class SendEmailTool(BaseTool):
     name: str = "Send Outreach Email"
@@ -1,19 +1,25 @@
+import logging
+
 from crewai_tools import BaseTool
 
+logger = logging.getLogger(__name__)
+
+# In a real scenario, this would use a web scraping tool or LinkedIn API.
+_MOCK_RESULTS = (
+    {"name": "Dr. Evelyn Reed", "email": "e.reed@example.com", "expertise": "Quantum Computing"},
+    {"name": "Marco Jin", "email": "m.jin@example.com", "expertise": "AI in FinTech"},
+    {"name": "Anya Sharma", "email": "a.sharma@example.com", "expertise": "Decentralized Science"},
+)
+# The results never change, so the tool's reply is formatted once at import
+_MOCK_RESULTS_STR = f"Found {len(_MOCK_RESULTS)} potential candidates: {list(_MOCK_RESULTS)}"
+
 
 class SourcingTools:
     @staticmethod
     def search_linkedin(topic: str) -> str:
         """A dummy function to simulate searching for experts on a given topic."""
-        print("\n--- DUMMY SOURCING TOOL ---")
-        print(f"ACTION: Searching for experts on the topic: '{topic}'")
-        # In a real scenario, this would use a web scraping tool or LinkedIn API.
-        mock_results = [
-            {"name": "Dr. Evelyn Reed", "email": "e.reed@example.com", "expertise": "Quantum Computing"},
-            {"name": "Marco Jin", "email": "m.jin@example.com", "expertise": "AI in FinTech"},
-            {"name": "Anya Sharma", "email": "a.sharma@example.com", "expertise": "Decentralized Science"},
-        ]
-        return f"Found 3 potential candidates: {mock_results}"
+        logger.debug("Dummy sourcing tool searching for experts on the topic: %r", topic)
+        return _MOCK_RESULTS_STR
 
 
 class SearchForExpertsTool(BaseTool):
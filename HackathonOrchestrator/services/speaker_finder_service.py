@@ -4,12 +4,14 @@ Speaker Finder Service for Hackathon Orchestrator
 Integrated service for finding speakers and creating Google Sheets
 """
 
+import hashlib
 import json
 import time
 from typing import List, Dict, Optional
 from pathlib import Path
 import requests
 from bs4 import BeautifulSoup
+from diskcache import Cache
 import re
 
 # Google Sheets integration
@@ -24,12 +26,24 @@ SCOPES = [
     "https://www.googleapis.com/auth/drive.metadata.readonly",
 ]
 
+# On-disk cache of scraped speakers so repeated topics skip the network, across restarts
+SCRAPE_CACHE_DIR = Path(__file__).parent.parent / ".speaker_finder_cache"
+SCRAPE_CACHE_TTL = 24 * 3600  # Seconds
+
+HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
+}
+
 
 class SpeakerFinderService:
     def __init__(self):
         self.sheets_service = None
         self.drive_service = None
         self._setup_google_services()
+        self.scrape_cache = Cache(str(SCRAPE_CACHE_DIR))
+        # Keep-alive session reused by every search, so repeat lookups skip the TCP/TLS handshake
+        self.http_session = requests.Session()
+        self.http_session.headers.update(HEADERS)
         
         # Demo data for when web scraping fails
         self.demo_speakers = {
@@ -62,6 +76,12 @@ class SpeakerFinderService:
                 {"name": "Mahmoud Kassem", "title": "Data Engineer at NYU", "location": "New York, NY", "email": "mki4895@nyu.edu", "source": "Demo Data", "query": "Data Science", "expertise": "Data Pipeline, ETL Processes"}
             ]
         }
+        # Lowercased name and one case-insensitive keyword alternation per category,
+        # computed once so matching a query is a containment test plus one regex scan.
+        self._category_matchers = [
+            (category, category.lower(), re.compile("|".join(map(re.escape, category.split())), re.IGNORECASE))
+            for category in self.demo_speakers
+        ]
     
     def _setup_google_services(self):
         """Initialize Google Sheets and Drive services."""
@@ -91,7 +111,8 @@ class SpeakerFinderService:
         
         # Try web scraping first
         try:
-            web_speakers = self._attempt_web_scraping(query, max_results)
+            # A blank query has nothing to search for; go straight to demo data
+            web_speakers = self._cached_web_scraping(query, max_results) if query.strip() else []
             if web_speakers:
                 speakers.extend(web_speakers)
         except Exception as e:
@@ -104,6 +125,20 @@ class SpeakerFinderService:
         
         return speakers[:max_results]
     
+    def _cached_web_scraping(self, query: str, max_results: int) -> List[Dict]:
+        """Scrape speakers for a query, reusing results cached on disk for the same normalized query."""
+        normalized = " ".join(query.lower().split())
+        cache_key = hashlib.blake2b(normalized.encode("utf-8"), digest_size=16).hexdigest()
+        cached = self.scrape_cache.get(cache_key)
+        # A cached run only answers requests for at most as many results as it asked for
+        if cached is not None and cached["max_results"] >= max_results:
+            return cached["speakers"][:max_results]
+        
+        speakers = self._attempt_web_scraping(query, max_results)
+        if speakers:
+            self.scrape_cache.set(cache_key, {"max_results": max_results, "speakers": speakers}, expire=SCRAPE_CACHE_TTL)
+        return speakers
+    
     def _attempt_web_scraping(self, query: str, max_results: int) -> List[Dict]:
         """Attempt to scrape speakers from web sources."""
         speakers = []
@@ -111,11 +146,7 @@ class SpeakerFinderService:
         try:
             # Try a simple search approach
             search_url = f"https://www.google.com/search?q={query.replace(' ', '+')}+speaker+expert"
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
-            }
-            
-            response = requests.get(search_url, headers=headers, timeout=10)
+            response = self.http_session.get(search_url, timeout=10)
             if response.status_code == 200:
                 soup = BeautifulSoup(response.content, 'html.parser')
                 
@@ -150,11 +181,12 @@ class SpeakerFinderService:
         best_match = None
         best_score = 0
         
-        for category in self.demo_speakers.keys():
+        query_lower = query.lower()
+        for category, category_lower, keywords in self._category_matchers:
             score = 0
-            if query.lower() in category.lower():
+            if query_lower in category_lower:
                 score += 3
-            if any(word in query.lower() for word in category.lower().split()):
+            if keywords.search(query):
                 score += 1
             if score > best_score:
                 best_score = score
@@ -197,19 +229,27 @@ class SpeakerFinderService:
                 ]
                 data.append(row)
             
-            # Write data to sheet
-            range_name = "Sheet1!A1:J" + str(len(data))
-            body = {"values": data}
-            
-            self.sheets_service.spreadsheets().values().update(
-                spreadsheetId=spreadsheet_id,
-                range=range_name,
-                valueInputOption="RAW",
-                body=body
-            ).execute()
-            
-            # Format headers and make it look professional
-            self._format_spreadsheet(spreadsheet_id)
+            # Write data and format it in one batchUpdate instead of separate values and format calls
+            write_data = {
+                "updateCells": {
+                    "start": {"sheetId": 0, "rowIndex": 0, "columnIndex": 0},
+                    "rows": [{"values": [{"userEnteredValue": {"stringValue": str(value)}} for value in row]} for row in data],
+                    "fields": "userEnteredValue"
+                }
+            }
+            body = {"requests": [write_data] + self._format_requests()}
+            try:
+                self.sheets_service.spreadsheets().batchUpdate(
+                    spreadsheetId=spreadsheet_id,
+                    body=body
+                ).execute()
+            except HttpError as e:
+                # batchUpdate is all-or-nothing; formatting is cosmetic, so retry with just the data
+                print(f"⚠️  Error formatting spreadsheet: {e}")
+                self.sheets_service.spreadsheets().batchUpdate(
+                    spreadsheetId=spreadsheet_id,
+                    body={"requests": [write_data]}
+                ).execute()
             
             return spreadsheet_id
             
@@ -217,69 +257,63 @@ class SpeakerFinderService:
             print(f"❌ Error creating spreadsheet: {e}")
             return None
     
-    def _format_spreadsheet(self, spreadsheet_id: str):
-        """Format the spreadsheet to make it look professional."""
-        try:
-            requests = [
-                # Format headers
-                {
-                    "repeatCell": {
-                        "range": {
-                            "sheetId": 0,
-                            "startRowIndex": 0,
-                            "endRowIndex": 1
-                        },
-                        "cell": {
-                            "userEnteredFormat": {
-                                "backgroundColor": {"red": 0.2, "green": 0.6, "blue": 0.9},
-                                "textFormat": {"bold": True, "foregroundColor": {"red": 1, "green": 1, "blue": 1}}
-                            }
-                        },
-                        "fields": "userEnteredFormat(backgroundColor,textFormat)"
-                    }
-                },
-                # Auto-resize columns
-                {
-                    "autoResizeDimensions": {
-                        "dimensions": {
-                            "sheetId": 0,
-                            "dimension": "COLUMNS",
-                            "startIndex": 0,
-                            "endIndex": 10
+    def _format_requests(self) -> List[Dict]:
+        """Build the batchUpdate requests that make the spreadsheet look professional."""
+        return [
+            # Format headers
+            {
+                "repeatCell": {
+                    "range": {
+                        "sheetId": 0,
+                        "startRowIndex": 0,
+                        "endRowIndex": 1
+                    },
+                    "cell": {
+                        "userEnteredFormat": {
+                            "backgroundColor": {"red": 0.2, "green": 0.6, "blue": 0.9},
+                            "textFormat": {"bold": True, "foregroundColor": {"red": 1, "green": 1, "blue": 1}}
                         }
-                    }
-                },
-                # Add borders to data
-                {
-                    "updateBorders": {
-                        "range": {
-                            "sheetId": 0,
-                            "startRowIndex": 0,
-                            "endRowIndex": 100,
-                            "startColumnIndex": 0,
-                            "endColumnIndex": 10
-                        },
-                        "top": {"style": "SOLID"},
-                        "bottom": {"style": "SOLID"},
-                        "left": {"style": "SOLID"},
-                        "right": {"style": "SOLID"}
+                    },
+                    "fields": "userEnteredFormat(backgroundColor,textFormat)"
+                }
+            },
+            # Auto-resize columns
+            {
+                "autoResizeDimensions": {
+                    "dimensions": {
+                        "sheetId": 0,
+                        "dimension": "COLUMNS",
+                        "startIndex": 0,
+                        "endIndex": 10
                     }
                 }
-            ]
-            
-            body = {"requests": requests}
-            self.sheets_service.spreadsheets().batchUpdate(
-                spreadsheetId=spreadsheet_id,
-                body=body
-            ).execute()
-            
-        except Exception as e:
-            print(f"⚠️  Error formatting spreadsheet: {e}")
+            },
+            # Add borders to data
+            {
+                "updateBorders": {
+                    "range": {
+                        "sheetId": 0,
+                        "startRowIndex": 0,
+                        "endRowIndex": 100,
+                        "startColumnIndex": 0,
+                        "endColumnIndex": 10
+                    },
+                    "top": {"style": "SOLID"},
+                    "bottom": {"style": "SOLID"},
+                    "left": {"style": "SOLID"},
+                    "right": {"style": "SOLID"}
+                }
+            }
+        ]
     
-    def find_and_create_sheet(self, requirements: str, max_results: int = 20) -> Optional[str]:
-        """Main method: search for speakers and create Google Sheets."""
+    def find_and_create_sheet(self, requirements: str, max_results: int = 20, speakers: Optional[List[Dict]] = None) -> Optional[str]:
+        """Main method: search for speakers and create Google Sheets.
+
+        Pass speakers from an earlier search_speakers() call to skip searching again.
+        """
         # Search for speakers
-        speakers = self.search_speakers(requirements, max_results)
+        if speakers is None:
+            speakers = self.search_speakers(requirements, max_results)
         
         if not speakers:
             return None
@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+Tests for the regexes the speaker agent uses to parse Google result pages.
+"""
+
+import re
+
+from agents.simple_speaker_agent import RESULT_BLOCK_PATTERN, _extract_name
+
+# The ordered patterns NAME_PATTERN replaced; the fused pattern must pick the same name
+LEGACY_NAME_PATTERNS = [
+    r'^([A-Z][a-z]+ [A-Z][a-z]+)',  # First Last
+    r'^([A-Z][a-z]+ [A-Z][a-z]+ [A-Z][a-z]+)',  # First Middle Last
+    r'([A-Z][a-z]+ [A-Z][a-z]+) -',  # Name - Title
+    r'([A-Z][a-z]+ [A-Z][a-z]+):',  # Name: Title
+]
+
+
+def legacy_extract_name(title):
+    for pattern in LEGACY_NAME_PATTERNS:
+        match = re.search(pattern, title)
+        if match:
+            name = match.group(1).strip()
+            if 2 <= len(name.split()) <= 4 and name.replace(' ', '').isalpha():
+                return name
+    return None
+
+
+def test_extract_name_matches_legacy_patterns():
+    titles = [
+        "Jane Doe Keynote Speaker on AI",
+        "Jane Doe - Keynote Speaker",
+        "Jane Doe: Keynote Speaker",
+        "Dr. Ann Lee - Professor of Finance",
+        "Dr. Ann Lee: Professor of Finance",
+        "the CTO: Ann Lee - Speaker",
+        "about: Bob Ray and Tim Ho - Panel",
+        "Keynote by Sam Ortiz",
+        "AI in FinTech 2024 | Speakers",
+        "line one\nMia Chen - Founder",
+        "",
+    ]
+    for title in titles:
+        assert _extract_name(title) == legacy_extract_name(title), title
+
+
+def test_result_block_pattern_matches_g_anywhere_in_class_list():
+    for tag in ('<div class="g">', '<div class="g tF2Cxc">', '<div class="MjjYud g">', '<div jsname="x" class="hlcw0c g Ww4FFb">'):
+        assert RESULT_BLOCK_PATTERN.search(tag), tag
+    for tag in ('<div class="gx">', '<div class="MjjYud">', '<div class="tg">', '<div data-class="g">'):
+        assert not RESULT_BLOCK_PATTERN.search(tag), tag